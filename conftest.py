@@ -0,0 +1,61 @@
+# -----------------------------------------------------------------------------.
+# MIT License
+
+# Copyright (c) 2024 pycolorbar developers
+#
+# This file is part of pycolorbar.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -----------------------------------------------------------------------------.
+"""Configure the pycolorbar test suite."""
+
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+# Minimum free space of the /dev/shm tmpfs required to store the test temporary files
+_SHM_MIN_FREE_BYTES = 256 * 1024**2
+
+
+def _has_enough_shm_space():
+    try:
+        stat = os.statvfs("/dev/shm")
+    except OSError:
+        return False
+    return stat.f_bavail * stat.f_frsize >= _SHM_MIN_FREE_BYTES
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """Store the test temporary files on the /dev/shm tmpfs (on Linux) if no --basetemp is specified.
+
+    A new directory is created for each test session (so that concurrent sessions do not remove
+    each other temporary files) and it is removed at the end of the session.
+    """
+    if config.option.basetemp or sys.platform != "linux" or not os.access("/dev/shm", os.W_OK):
+        return
+    if not _has_enough_shm_space():
+        return
+    basetemp = tempfile.mkdtemp(dir="/dev/shm", prefix="pytest-pycolorbar-")
+    config.option.basetemp = basetemp
+    config.add_cleanup(lambda: shutil.rmtree(basetemp, ignore_errors=True))
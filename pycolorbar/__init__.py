@@ -36,7 +36,11 @@ from pycolorbar.settings.colorbar_registry import (  # noqa
     register_colorbars,
 )
 from pycolorbar.settings.colorbar_validator import validate_cbar_dict  # noqa
-from pycolorbar.settings.colorbar_visualization import show_colorbar, show_colorbars  # noqa
+from pycolorbar.settings.colorbar_visualization import (  # noqa
+    export_colorbars,
+    show_colorbar,
+    show_colorbars,
+)
 from pycolorbar.settings.colormap_registry import (  # noqa
     ColormapRegistry,
     available_colormaps,
@@ -26,12 +26,39 @@
 # -----------------------------------------------------------------------------.
 """Define the register of univiariate colorbars."""
 
+import copy
 import os
+import sys
 
 from pycolorbar.settings.colorbar_io import read_cbar_dicts, write_cbar_dicts
 from pycolorbar.settings.colorbar_validator import validate_cbar_dict
+from pycolorbar.settings.colorbar_visualization import plot_colorbar, plot_colorbars, save_colorbars
+from pycolorbar.settings.matplotlib_kwargs import get_cmap, get_plot_cbar_kwargs, update_plot_cbar_kwargs
 from pycolorbar.settings.utils import get_auxiliary_categories
-from pycolorbar.utils.yaml import list_yaml_files
+from pycolorbar.utils.yaml import iter_yaml_files
+
+
+def _check_if_cbar_in_use(name, cbar_dicts, force):
+    """Check if a colorbar name is already in use.
+
+    Return `True` if the existing colorbar settings will be overwritten.
+    """
+    if name in cbar_dicts:
+        if not force:
+            raise ValueError(
+                f"A colorbar setting named '{name}' already exists. To allow overwriting, set 'force=True'."
+            )
+        return True
+    return False
+
+
+def _print_overwriting_warning(names, verbose):
+    """Print a single warning listing the overwritten colorbars."""
+    if verbose and names:
+        if len(names) == 1:
+            print(f"Warning: Overwriting existing colorbar '{names[0]}'")
+        else:
+            print(f"Warning: Overwriting existing colorbars {names}")
 
 
 class ColorbarRegistry:
@@ -56,6 +83,20 @@ class ColorbarRegistry:
             cls._instance = super().__new__(cls)
             #  cls._instance = super(ColorbarRegistry, cls).__new__(cls)
             cls._instance.registry = {}
+            # Cache of the sorted registered names (reset at each registry update)
+            cls._instance._names_cache = None
+            # Cache of the validated colorbar dictionaries (reset at each registry update)
+            cls._instance._cbar_dict_cache = {}
+            # Index of the standalone and referenced colorbar names per (upper case) category (built lazily)
+            cls._instance._category_indices = {}
+            # Names of the standalone and referenced colorbars settings
+            cls._instance._standalone = set()
+            cls._instance._referenced = set()
+            # Mapping of the referenced colorbars to the referenced standalone colorbar (filled lazily)
+            cls._instance._reference_targets = {}
+            # Registry generation (incremented at each registry update) at which the colorbars were validated
+            cls._instance._validation_gen = 0
+            cls._instance._validated_at = {}
         return cls._instance
 
     @classmethod
@@ -67,24 +108,59 @@ class ColorbarRegistry:
     def reset(self):
         """Clears the entire Colorbar registry."""
         self.registry.clear()
+        self._standalone.clear()
+        self._referenced.clear()
+        self._validated_at.clear()
+        self._reset_cache()
+
+    def _reset_cache(self):
+        """Reset the cached information derived from the registry."""
+        self._names_cache = None
+        self._cbar_dict_cache.clear()
+        self._category_indices.clear()
+        self._reference_targets.clear()
+        self._validation_gen += 1
+
+    def _set_cbar_dict(self, name, cbar_dict):
+        """Set a colorbar dictionary in the registry."""
+        self._set_cbar_dicts({name: cbar_dict})
+
+    def _set_cbar_dicts(self, cbar_dicts):
+        """Set multiple colorbar dictionaries in the registry."""
+        for name, cbar_dict in cbar_dicts.items():
+            # Intern the names to speed up the repeated dictionary and set lookups
+            if isinstance(name, str):
+                name = sys.intern(name)
+            reference = cbar_dict.get("reference") if isinstance(cbar_dict, dict) else None
+            if isinstance(reference, str):
+                # Do not modify the input dictionary
+                cbar_dict = {**cbar_dict, "reference": sys.intern(reference)}
+            self.registry[name] = cbar_dict
+            if reference is not None:
+                self._standalone.discard(name)
+                self._referenced.add(name)
+            else:
+                self._referenced.discard(name)
+                self._standalone.add(name)
+        self._reset_cache()
+
+    def _get_sorted_names(self):
+        """Return the cached tuple of the sorted registered colorbars names."""
+        if self._names_cache is None:
+            self._names_cache = tuple(sorted(self.registry))
+        return self._names_cache
 
     @property
     def names(self):
         """List the names of all registered colorbars settings."""
-        return sorted(list(self.registry))
+        return list(self._get_sorted_names())
 
     def __contains__(self, item):
         """Test registration of a colorbar in the registry."""
-        return item in self.names
+        return item in self.registry
 
-    def _check_if_cbar_in_use(self, name, force, verbose):
-        if name in self.registry:
-            if force and verbose:
-                print(f"Warning: Overwriting existing colorbar '{name}'")
-            if not force:
-                raise ValueError(
-                    f"A colorbar setting named '{name}' already exists. To allow overwriting, set 'force=True'."
-                )
+    def _check_if_cbar_in_use(self, name, force):
+        return _check_if_cbar_in_use(name=name, cbar_dicts=self.registry, force=force)
 
     def register(self, filepath: str, verbose: bool = True, force: bool = True, validate=False):
         """
@@ -116,11 +192,56 @@ class ColorbarRegistry:
         # Read colorbars settings
         cbar_dicts = read_cbar_dicts(filepath=filepath)
         # Register colorbars settings
-        for name, cbar_dict in cbar_dicts.items():
-            if validate:
-                cbar_dict = validate_cbar_dict(cbar_dict=cbar_dict, name=name)
-            self._check_if_cbar_in_use(name=name, force=force, verbose=verbose)
-            self.registry[name] = cbar_dict
+        self.register_many(cbar_dicts, verbose=verbose, force=force, validate=validate)
+
+    def register_many(self, cbar_dicts: dict, verbose: bool = True, force: bool = True, validate=False):
+        """
+        Register multiple colorbar configurations at once.
+
+        Parameters
+        ----------
+        cbar_dicts : dict
+            A dictionary mapping the colorbar names to their colorbar dictionary.
+        force : bool, optional
+            If `True`, it allow to overwrites existing colorbar settings. The default is `True`.
+            If `False`, it raise an error if attempting to overwrite an existing colorbar.
+        verbose : bool, optional
+            If `True`, the method will print a warning when overwriting existing colorbars. The default is `True`.
+        validate: bool, optional
+            Whether to validate the colorbar configurations when registering.
+            The colorbars can reference the other colorbars being registered.
+            If a configuration is invalid, none of the colorbars is registered.
+            The default is `False`.
+        """
+        # Check only the colorbars already registered
+        overwritten_names = sorted(self.registry.keys() & cbar_dicts.keys())
+        for name in overwritten_names:
+            _ = self._check_if_cbar_in_use(name=name, force=force)
+        # Update registry
+        if validate:
+            self._set_validated_cbar_dicts(cbar_dicts)
+        else:
+            self._set_cbar_dicts(cbar_dicts)
+        _print_overwriting_warning(overwritten_names, verbose=verbose)
+
+    def _set_validated_cbar_dicts(self, cbar_dicts):
+        """Validate and set multiple colorbar dictionaries in the registry.
+
+        The colorbar dictionaries are validated once all are registered, so that they can reference
+        each other. If a colorbar dictionary is invalid, the registry is restored to its previous state.
+        """
+        previous_cbar_dicts = {name: self.registry[name] for name in cbar_dicts if name in self.registry}
+        self._set_cbar_dicts(cbar_dicts)
+        try:
+            validated_cbar_dicts = {
+                name: validate_cbar_dict(cbar_dict=cbar_dict, name=name) for name, cbar_dict in cbar_dicts.items()
+            }
+        except Exception:
+            for name in cbar_dicts.keys() - previous_cbar_dicts.keys():
+                self.unregister(name)
+            self._set_cbar_dicts(previous_cbar_dicts)
+            raise
+        self._set_cbar_dicts(validated_cbar_dicts)
 
     def add_cbar_dict(self, cbar_dict: dict, name: str, verbose: bool = True, force: bool = True):
         """
@@ -144,11 +265,12 @@ class ColorbarRegistry:
         The configuration is validated when adding a colorbar configuration with this method !
         """
         # Check if the name is already used
-        self._check_if_cbar_in_use(name=name, force=force, verbose=verbose)
+        if self._check_if_cbar_in_use(name=name, force=force):
+            _print_overwriting_warning([name], verbose=verbose)
         # Validate cbar_dict
         cbar_dict = validate_cbar_dict(cbar_dict, name=name)
         # Update registry
-        self.registry[name] = cbar_dict
+        self._set_cbar_dict(name, cbar_dict)
 
     def unregister(self, name: str):
         """
@@ -164,10 +286,13 @@ class ColorbarRegistry:
         ValueError
             If the colorbar with the specified name is not registered.
         """
-        if name in self.registry:
+        try:
             _ = self.registry.pop(name)
-        else:
-            raise ValueError(f"The colorbar configuration for {name} is not registered in pycolorbar.")
+        except KeyError:
+            raise ValueError(f"The colorbar configuration for {name} is not registered in pycolorbar.") from None
+        self._standalone.discard(name)
+        self._referenced.discard(name)
+        self._reset_cache()
 
     def get_cbar_dict(self, name: str, resolve_reference=True, validate=True):
         """
@@ -196,13 +321,50 @@ class ColorbarRegistry:
         ------
         ValueError
             If the colorbar configuration is not registered.
+
+        Notes
+        -----
+        The validated colorbar dictionaries are cached until the registry is updated.
+        A copy of the cached dictionary is returned, so it can be safely modified.
         """
-        if name not in self.registry:
-            raise ValueError(f"The colorbar configuration for {name} is not registered in pycolorbar.")
-        cbar_dict = self.registry[name].copy()
-        if validate:
-            cbar_dict = validate_cbar_dict(cbar_dict, name=name, resolve_reference=resolve_reference)
-        return cbar_dict
+        try:
+            cbar_dict = self.registry[name]
+        except KeyError:
+            raise ValueError(f"The colorbar configuration for {name} is not registered in pycolorbar.") from None
+        if not validate:
+            return cbar_dict.copy()
+        return copy.deepcopy(self._get_validated_cbar_dict(name, resolve_reference=resolve_reference))
+
+    def _get_validated_cbar_dict(self, name, resolve_reference):
+        """Return the cached validated colorbar dictionary (which must not be modified)."""
+        key = (name, resolve_reference)
+        if key not in self._cbar_dict_cache:
+            target = self._get_reference_target(name) if resolve_reference else None
+            if target is not None:
+                # Check the reference, then share the validated settings of the referenced colorbar
+                _ = self._get_validated_cbar_dict(name, resolve_reference=False)
+                cbar_dict = self._get_validated_cbar_dict(target, resolve_reference=True)
+            else:
+                cbar_dict = validate_cbar_dict(self.registry[name], name=name, resolve_reference=resolve_reference)
+            self._cbar_dict_cache[key] = cbar_dict
+        return self._cbar_dict_cache[key]
+
+    def _get_reference_target(self, name):
+        """Return the name of the standalone colorbar settings a referenced colorbar points to.
+
+        Returns `None` if the colorbar is not a reference or if the chain of references is broken or circular.
+        """
+        if name not in self._reference_targets:
+            target, visited = name, set()
+            while target in self._referenced and target not in visited:
+                visited.add(target)
+                target = self.registry[target]["reference"]
+                # Stop at invalid references (which are reported by the validation)
+                if not isinstance(target, str):
+                    target = None
+                    break
+            self._reference_targets[name] = target if name in self._referenced and target in self._standalone else None
+        return self._reference_targets[name]
 
     def get_cmap(self, name):
         """
@@ -223,8 +385,6 @@ class ColorbarRegistry:
         This function also sets the over/under and bad colors specified in the colorbar configuration.
 
         """
-        from pycolorbar.settings.matplotlib_kwargs import get_cmap
-
         cbar_dict = self.get_cbar_dict(name=name, resolve_reference=True)
         return get_cmap(cbar_dict)
 
@@ -259,14 +419,20 @@ class ColorbarRegistry:
         if isinstance(name, str):
             names = [name]
         else:
-            names = self.names
+            names = self._get_sorted_names()
 
         # Validate colorbars
         wrong_names = []
         for name in names:
+            # Skip colorbars already validated since the last registry update
+            if self._validated_at.get(name) == self._validation_gen:
+                continue
             try:
-                cbar_dict = self.get_cbar_dict(name, resolve_reference=False)
-                _ = validate_cbar_dict(cbar_dict=cbar_dict, name=name)
+                if name not in self.registry:
+                    raise ValueError(f"The colorbar configuration for {name} is not registered in pycolorbar.")
+                # Validate (and cache) the colorbar dictionary
+                _ = self._get_validated_cbar_dict(name, resolve_reference=False)
+                self._validated_at[name] = self._validation_gen
             except Exception as e:
                 wrong_names.append(name)
                 print(f"{name} has an invalid configuration: {e}")
@@ -277,21 +443,11 @@ class ColorbarRegistry:
 
     def get_standalone_settings(self):
         """Return the colorbar settings names which are not a reference to another colorbar."""
-        names = []
-        for name in self.names:
-            cbar_dict = self.get_cbar_dict(name, resolve_reference=False)
-            if "reference" not in cbar_dict:
-                names.append(name)
-        return names
+        return [name for name in self._get_sorted_names() if name in self._standalone]
 
     def get_referenced_settings(self):
         """Return the colorbar settings names which a reference to another colorbar."""
-        names = []
-        for name in self.names:
-            cbar_dict = self.get_cbar_dict(name, resolve_reference=False)
-            if "reference" in cbar_dict:
-                names.append(name)
-        return names
+        return [name for name in self._get_sorted_names() if name in self._referenced]
 
     def available(self, category=None, exclude_referenced=False):
         """List the name of available colorbars for a specific category."""
@@ -304,19 +460,27 @@ class ColorbarRegistry:
             return names
 
         # Subset names by category
-        cat_names = []
-        for name in names:
-            cbar_dict = self.get_cbar_dict(name, resolve_reference=True)
-            categories = get_auxiliary_categories(cbar_dict)
-            categories = [cat.upper() for cat in categories]
-            if category.upper() in categories:
-                cat_names.append(name)
-        return cat_names
-
-    def show_colorbar(self, name, user_plot_kwargs={}, user_cbar_kwargs={}, fig_size=(6, 1)):
+        # - The referenced colorbars are resolved only if they are not excluded
+        category = category.upper()
+        category_names = self._get_category_index(referenced=False).get(category, set())
+        if not exclude_referenced:
+            category_names = category_names | self._get_category_index(referenced=True).get(category, set())
+        return sorted(category_names)
+
+    def _get_category_index(self, referenced):
+        """Return a dictionary mapping each (upper case) category to the set of standalone or referenced names."""
+        if referenced not in self._category_indices:
+            category_index = {}
+            for name in self._referenced if referenced else self._standalone:
+                # The cached validated colorbar dictionary is only read, so it does not need to be copied
+                cbar_dict = self._get_validated_cbar_dict(name, resolve_reference=True)
+                for category in get_auxiliary_categories(cbar_dict):
+                    category_index.setdefault(category.upper(), set()).add(name)
+            self._category_indices[referenced] = category_index
+        return self._category_indices[referenced]
+
+    def show_colorbar(self, name, user_plot_kwargs=None, user_cbar_kwargs=None, fig_size=(6, 1)):
         """Display a colorbar (updated with optional user arguments)."""
-        from pycolorbar.settings.colorbar_visualization import plot_colorbar
-
         plot_kwargs, cbar_kwargs = self.get_plot_kwargs(
             name=name, user_plot_kwargs=user_plot_kwargs, user_cbar_kwargs=user_cbar_kwargs
         )
@@ -324,8 +488,6 @@ class ColorbarRegistry:
 
     def show_colorbars(self, category=None, exclude_referenced=True, subplot_size=None):
         """Display available colorbars (optionally of a specific category)"""
-        from pycolorbar.settings.colorbar_visualization import plot_colorbars
-
         # TODO: allow for names subset ?
 
         # Retrieve available (of a given category) colorbars settings
@@ -339,23 +501,49 @@ class ColorbarRegistry:
             return None
 
         # Display colorbars
-        list_args = [[name] + list(self.get_plot_kwargs(name=name)) for name in names]
+        get_plot_kwargs = self.get_plot_kwargs
+        list_args = [[name, *get_plot_kwargs(name=name)] for name in names]
         plot_colorbars(list_args, subplot_size=subplot_size)
 
-    def get_plot_kwargs(self, name=None, user_plot_kwargs=None, user_cbar_kwargs=None):
-        """Get pycolorbar plot kwargs (updated with optional user arguments)."""
-        from pycolorbar.settings.matplotlib_kwargs import (
-            get_plot_cbar_kwargs,
-            update_plot_cbar_kwargs,
+    def export_colorbars(
+        self,
+        directory,
+        category=None,
+        exclude_referenced=True,
+        subplot_size=(6, 1),
+        dpi=200,
+        max_workers=None,
+    ):
+        """Export available colorbars (optionally of a specific category) to ``<name>.png`` files in a directory."""
+        # Retrieve available (of a given category) colorbars settings
+        names = self.available(category=category, exclude_referenced=exclude_referenced)
+        if len(names) == 0:
+            raise ValueError("No colorbars are yet registered in the pycolorbar ColorbarRegistry.")
+
+        # Export colorbars
+        get_plot_kwargs = self.get_plot_kwargs
+        list_args = [[name, *get_plot_kwargs(name=name)] for name in names]
+        return save_colorbars(
+            list_args,
+            directory=directory,
+            subplot_size=subplot_size,
+            dpi=dpi,
+            max_workers=max_workers,
         )
 
+    def get_plot_kwargs(self, name=None, user_plot_kwargs=None, user_cbar_kwargs=None):
+        """Get pycolorbar plot kwargs (updated with optional user arguments)."""
         if not isinstance(name, (str, type(None))):
             raise TypeError("Expecting the colorbar setting name.")
 
-        try:
-            cbar_dict = self.get_cbar_dict(name)
-        except Exception:
+        # Use the default settings if the colorbar is not specified or is not registered
+        if name is None or name not in self.registry:
             cbar_dict = {}
+        else:
+            try:
+                cbar_dict = self.get_cbar_dict(name)
+            except ValueError:
+                cbar_dict = {}
 
         # Retrieve defaults pycolorbar kwargs
         plot_kwargs, cbar_kwargs = get_plot_cbar_kwargs(cbar_dict)
@@ -368,6 +556,10 @@ class ColorbarRegistry:
         return plot_kwargs, cbar_kwargs
 
 
+# Module-level instance of the ColorbarRegistry used by the functions below
+_REGISTRY = ColorbarRegistry.get_instance()
+
+
 def register_colorbars(directory: str, verbose: bool = True, force: bool = True):
     """
     Register all colorbar YAML files present in the specified directory (if name=None).
@@ -391,13 +583,21 @@ def register_colorbars(directory: str, verbose: bool = True, force: bool = True)
     The validity of the colorbar(s) configuration(s) is not validated at registration !
     Use `pycolorbar.colorbars.validate()` to validate the registered colorbars.
     """
-    # List the colorbar YAML files to register
-    filepaths = list_yaml_files(directory)
+    # Read the colorbars settings of all YAML files
+    cbar_dicts = {}
+    overwritten_names = set()
+    for filepath in iter_yaml_files(directory):
+        for name, cbar_dict in read_cbar_dicts(filepath=filepath).items():
+            if _check_if_cbar_in_use(name=name, cbar_dicts=cbar_dicts, force=force):
+                overwritten_names.add(name)
+            cbar_dicts[name] = cbar_dict
+    overwritten_names |= _REGISTRY.registry.keys() & cbar_dicts.keys()
 
     # Add colorbars to the ColorbarRegistry
-    colorbars = ColorbarRegistry.get_instance()
-    for filepath in filepaths:
-        colorbars.register(filepath, force=force, verbose=verbose)
+    _REGISTRY.register_many(cbar_dicts, force=force, verbose=False)
+
+    # Print a single warning for the colorbars duplicated in the directory or already registered
+    _print_overwriting_warning(sorted(overwritten_names), verbose=verbose)
 
 
 def register_colorbar(filepath: str, verbose: bool = True, force: bool = True):
@@ -425,8 +625,7 @@ def register_colorbar(filepath: str, verbose: bool = True, force: bool = True):
     The validity of the colorbar(s) configuration(s) is not validated at registration !
     Use `pycolorbar.colorbars.validate()` to validate the registered colorbars.
     """
-    colorbars = ColorbarRegistry.get_instance()
-    colorbars.register(filepath, verbose=verbose, force=force)
+    _REGISTRY.register(filepath, verbose=verbose, force=force)
 
 
 def get_cbar_dict(name, resolve_reference=True):
@@ -450,8 +649,7 @@ def get_cbar_dict(name, resolve_reference=True):
         The validated colorbar dictionary.
 
     """
-    colorbars = ColorbarRegistry.get_instance()
-    return colorbars.get_cbar_dict(name, resolve_reference=resolve_reference)
+    return _REGISTRY.get_cbar_dict(name, resolve_reference=resolve_reference)
 
 
 def get_plot_kwargs(name=None, user_plot_kwargs=None, user_cbar_kwargs=None):
@@ -496,8 +694,7 @@ def get_plot_kwargs(name=None, user_plot_kwargs=None, user_cbar_kwargs=None):
         gdf.plot(**plot_kwargs, legend=False)
         plt.colorbar(**cbar_kwargs)
     """
-    colorbars = ColorbarRegistry.get_instance()
-    return colorbars.get_plot_kwargs(name=name, user_plot_kwargs=user_plot_kwargs, user_cbar_kwargs=user_cbar_kwargs)
+    return _REGISTRY.get_plot_kwargs(name=name, user_plot_kwargs=user_plot_kwargs, user_cbar_kwargs=user_cbar_kwargs)
 
 
 def available_colorbars(category=None, exclude_referenced=False):
@@ -520,6 +717,5 @@ def available_colorbars(category=None, exclude_referenced=False):
     names : str
         List of registered colorbars.
     """
-    colorbars = ColorbarRegistry.get_instance()
-    names = colorbars.available(category=category, exclude_referenced=exclude_referenced)
+    names = _REGISTRY.available(category=category, exclude_referenced=exclude_referenced)
     return names
@@ -26,14 +26,59 @@
 # -----------------------------------------------------------------------------.
 """Implementation of pydantic validator for univariate colorbar YAML files."""
 
-import re
-from typing import Optional, Union
+import copy
+import numbers
+from functools import lru_cache
+from typing import ClassVar, Optional, Union
 
 import numpy as np
 from pydantic import BaseModel, ConfigDict, field_validator, model_validator
 
 from pycolorbar.utils.mpl import get_mpl_colormaps, get_mpl_named_colors
 
+# Types used in the isinstance checks
+_NUMBER_TYPES = (int, float)
+_NUMBER_OR_NONE_TYPES = (int, float, type(None))
+_SEQUENCE_TYPES = (list, tuple)
+
+# Minimum number of values for which the list checks are performed with numpy
+_NUMPY_MIN_SIZE = 16
+
+# Valid digits of the hex color strings
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+# Sets of the matplotlib colormaps and named colors (used for fast membership tests)
+_MPL_COLORMAPS = frozenset(get_mpl_colormaps())
+_MPL_NAMED_COLORS = frozenset(get_mpl_named_colors().tolist())
+
+# Lazily imported pycolorbar module (to avoid circular imports)
+_pycolorbar = None
+
+
+def _get_pycolorbar():
+    """Return the pycolorbar module, importing it at the first call."""
+    global _pycolorbar
+    if _pycolorbar is None:
+        import pycolorbar
+
+        _pycolorbar = pycolorbar
+    return _pycolorbar
+
+
+def _is_hex_color(color):
+    """Check if a string is an hex color ("#RGB", "#RRGGBB" or "#RRGGBBAA")."""
+    return len(color) in (4, 7, 9) and color[0] == "#" and _HEX_DIGITS.issuperset(color[1:])
+
+
+def _is_valid_cmap_name(name):
+    """Check if a colormap name is available in matplotlib or pycolorbar."""
+    if name in _MPL_COLORMAPS:
+        return True
+    pycolorbar = _get_pycolorbar()
+    # Also account for colormaps registered in matplotlib after import
+    return name in pycolorbar.colormaps.registry or name in get_mpl_colormaps()
+
+
 ####---------------------------------------------------------------------------------------------------------.
 #### Colormap Settings
 
@@ -53,53 +98,50 @@ class ColormapSettings(BaseModel):
     @field_validator("name")
     def validate_name(cls, v):
         """Check if cmap is a registered matplotlib colormap or name in pycolorbar.colormaps.registry."""
-        import pycolorbar
-
         if isinstance(v, str):
-            valid_names = get_mpl_colormaps() + pycolorbar.colormaps.names
-            assert v in valid_names, f"'{v}' is not a recognized colormap name."
+            if not _is_valid_cmap_name(v):
+                raise ValueError(f"'{v}' is not a recognized colormap name.")
         elif isinstance(v, list):
             for name in v:
-                valid_names = get_mpl_colormaps() + pycolorbar.colormaps.names
-                assert name in valid_names, f"'{name}' is not a recognized colormap name."
+                if not _is_valid_cmap_name(name):
+                    raise ValueError(f"'{name}' is not a recognized colormap name.")
         return v
 
     @field_validator("n")
     def validate_n(cls, v, values, **kwargs):
         if v is not None:
-            validated_settings = values.data
+            name = values.data.get("name")
             # Single colormap
-            if isinstance(validated_settings.get("name"), str):
-                assert isinstance(v, int) and v > 0, "'n' must be a positive integer."
+            if isinstance(name, str):
+                if not (isinstance(v, int) and v > 0):
+                    raise ValueError("'n' must be a positive integer.")
             # Multiple colormaps
-            if isinstance(validated_settings.get("name"), list):
-                assert len(validated_settings.get("name")) == len(
-                    v
-                ), "'n' must match the number of color maps in 'name'."
+            elif isinstance(name, list):
+                if len(name) != len(v):
+                    raise ValueError("'n' must match the number of color maps in 'name'.")
                 for n in v:
-                    assert isinstance(n, int) and n > 0, "'n' values must be positive integers."
+                    if not (isinstance(n, int) and n > 0):
+                        raise ValueError("'n' values must be positive integers.")
         return v
 
     @field_validator("bad_color", "over_color", "under_color")
     def validate_colors(cls, v):
         if v is not None:
             if isinstance(v, str):
-                if v == "none":
-                    return v
-                # Check if it's a named color
-                if v in get_mpl_named_colors():
-                    return v
-                # Check if it's a hex color
-                hex_color_pattern = re.compile(r"^#(?:[0-9a-fA-F]{3}){1,2}$")
-                if not hex_color_pattern.match(v):
+                # Check if it's a hex color (the most common case) or a named color
+                if v.startswith("#"):
+                    is_valid_color = _is_hex_color(v)
+                else:
+                    is_valid_color = v == "none" or v in _MPL_NAMED_COLORS
+                if not is_valid_color:
                     raise ValueError(
                         'Invalid color format. Expected hex string like "#RRGGBB" or "#RRGGBBAA", or a named color.'
                     )
-            elif isinstance(v, (list, tuple)) and len(v) in [3, 4]:
+            elif isinstance(v, _SEQUENCE_TYPES) and len(v) in [3, 4]:
                 # Check if it's an RGB or RGBA tuple
-                if not all(
-                    isinstance(color_component, (int, float)) and 0 <= color_component <= 1 for color_component in v
-                ):
+                # - numbers.Real also includes the numpy scalars (i.e. np.float32)
+                # - The chained comparison rejects NaN values
+                if not all(isinstance(c, numbers.Real) and 0 <= c <= 1 for c in v):
                     raise ValueError("Invalid RGB/RGBA format. Expected tuple with values between 0 and 1.")
             else:
                 raise ValueError("Invalid color format. Expected a named color, hex string, or RGB/RGBA tuple.")
@@ -108,7 +150,8 @@ class ColormapSettings(BaseModel):
     @field_validator("bad_alpha", "under_alpha", "over_alpha")
     def validate_bad_alpha(cls, v):
         if v is not None:
-            assert 0 <= v <= 1, "bad_alpha must be between 0 and 1"
+            if not (0 <= v <= 1):
+                raise ValueError("bad_alpha must be between 0 and 1")
         return v
 
 
@@ -116,43 +159,79 @@ class ColormapSettings(BaseModel):
 #### Norm Settings
 
 
+# Valid extend options
+_VALID_EXTENDS = ("neither", "both", "min", "max")
+
+# Valid arguments of the *Norm settings
+_VMIN_VMAX_CLIP_ARGS = frozenset(("vmin", "vmax", "clip"))
+_CATEGORY_NORM_ARGS = frozenset(("labels", "first_value"))
+_BOUNDARY_NORM_ARGS = frozenset(("boundaries", "ncolors", "clip", "extend"))
+_CENTERED_NORM_ARGS = frozenset(("vcenter", "halfrange", "clip"))
+_TWO_SLOPE_NORM_ARGS = frozenset(("vcenter", "vmin", "vmax"))
+_SYMLOG_NORM_ARGS = frozenset(("linthresh", "linscale", "vmin", "vmax", "clip", "base"))
+_POWER_NORM_ARGS = frozenset(("gamma", "vmin", "vmax", "clip"))
+_ASINH_NORM_ARGS = frozenset(("linear_width", "vmin", "vmax", "clip"))
+
+
 def _check_norm_invalid_args(norm_name, args, valid_args):
-    invalid_keys = set(args) - set(valid_args)
+    # 'args' can be any iterable of argument names (i.e. the keys view of the norm settings or a list)
+    invalid_keys = set(args).difference(valid_args)
     if invalid_keys:
-        raise ValueError(f"Invalid parameters {invalid_keys} for normalization type '{norm_name}'.")
+        raise ValueError(f"Invalid parameters {sorted(invalid_keys)} for normalization type '{norm_name}'.")
 
 
 def _check_vmin_vcenter_vmax(vmin, vcenter, vmax, norm_name):
     if vmin is not None and vcenter is not None:
-        assert vmin < vcenter, "'vmin' must be less than 'vcenter' for 'TwoSlopeNorm'."
+        if vmin >= vcenter:
+            raise ValueError("'vmin' must be less than 'vcenter' for 'TwoSlopeNorm'.")
     if vmax is not None and vcenter is not None:
-        assert vcenter < vmax, "'vmax' must be larger than 'vcenter' 'TwoSlopeNorm'."
+        if vcenter >= vmax:
+            raise ValueError("'vmax' must be larger than 'vcenter' 'TwoSlopeNorm'.")
 
 
 def _check_vmin_vmax(vmin, vmax):
-    assert isinstance(vmin, (int, float, type(None))), "'vmin' must be an integer, float or None."
-    assert isinstance(vmax, (int, float, type(None))), "'vmax' must be an integer, float or None."
+    if not isinstance(vmin, _NUMBER_OR_NONE_TYPES):
+        raise ValueError("'vmin' must be an integer, float or None.")
+    if not isinstance(vmax, _NUMBER_OR_NONE_TYPES):
+        raise ValueError("'vmax' must be an integer, float or None.")
     if vmin is not None and vmax is not None:
-        assert vmin < vmax, "vmin must be less than vmax."
+        if vmin >= vmax:
+            raise ValueError("vmin must be less than vmax.")
 
 
 def _check_clip(clip):
-    assert isinstance(clip, bool), "'clip' must be either True or False."
+    if not isinstance(clip, bool):
+        raise ValueError("'clip' must be either True or False.")
 
 
 def _check_extend(extend):
-    valid_extends = ["neither", "both", "min", "max"]
-    assert extend in valid_extends, f"Invalid extend option '{extend}'. Valid options are {valid_extends}."
+    if extend not in _VALID_EXTENDS:
+        raise ValueError(f"Invalid extend option '{extend}'. Valid options are {list(_VALID_EXTENDS)}.")
 
 
 def _is_monotonically_increasing(x):
-    x = np.asanyarray(x)
-    return np.all(x[1:] > x[:-1])
+    return all(previous < current for previous, current in zip(x, x[1:]))
+
 
+def _check_boundaries_values(boundaries):
+    """Check the boundaries are monotonically increasing numbers.
+
+    Long boundaries lists are checked with numpy, while short lists are checked element by element.
+    """
+    if len(boundaries) >= _NUMPY_MIN_SIZE:
+        arr = np.asarray(boundaries)
+        if not (arr.ndim == 1 and arr.dtype.kind in "iuf"):
+            raise ValueError("'boundaries' must be a list of numbers.")
+        if not np.all(np.diff(arr) > 0):
+            raise ValueError("'boundaries' must be monotonically increasing.")
+    else:
+        if not all(isinstance(b, _NUMBER_TYPES) for b in boundaries):
+            raise ValueError("'boundaries' must be a list of numbers.")
+        if not _is_monotonically_increasing(boundaries):
+            raise ValueError("'boundaries' must be monotonically increasing.")
 
-def _get_boundary_norm_expected_ncolors(norm_settings):
-    boundaries = norm_settings.get("boundaries", [])
-    extend = norm_settings.get("extend", "neither")
+
+def _get_boundary_norm_expected_ncolors(boundaries, extend="neither"):
     if extend == "neither":
         required_ncolors = len(boundaries) - 1
     elif extend in ["min", "max"]:
@@ -162,33 +241,45 @@ def _get_boundary_norm_expected_ncolors(norm_settings):
     return required_ncolors
 
 
-class NormalizeSettings(BaseModel):
-    vmin: Optional[float] = None
-    vmax: Optional[float] = None
-    clip: Optional[bool] = False
+class _VminVmaxClipNormValidators(BaseModel):
+    """Validators shared by the norms accepting the `vmin`, `vmax` and `clip` arguments.
 
-    @field_validator("clip")
+    The fields are declared by the subclasses, so that they are dumped in the norm arguments order.
+    """
+
+    _NORM_NAME: ClassVar[str] = "Normalize"
+    _VALID_ARGS: ClassVar[frozenset] = _VMIN_VMAX_CLIP_ARGS
+
+    @field_validator("clip", check_fields=False)
     def validate_clip(cls, v):
-        """Validate `clip` option for Normalize."""
+        """Validate `clip` option."""
         _check_clip(v)
         return v
 
     @model_validator(mode="before")
-    def check_vmin_vmax(cls, values):
-        """Check `vmin` and `vmax` for Normalize."""
+    def check_settings(cls, values):
+        """Check for no excess parameters and check `vmin` and `vmax`."""
+        _check_norm_invalid_args(norm_name=cls._NORM_NAME, args=values.keys(), valid_args=cls._VALID_ARGS)
         vmin, vmax = values.get("vmin"), values.get("vmax")
         _check_vmin_vmax(vmin, vmax)
         return values
 
-    @model_validator(mode="before")
-    def check_valid_args(cls, values):
-        """Check for no excess parameters in Normalize."""
-        valid_args = {"vmin", "vmax", "clip"}
-        _check_norm_invalid_args(norm_name="Normalize", args=values.keys(), valid_args=valid_args)
-        return values
+
+class _VminVmaxClipNormSettings(_VminVmaxClipNormValidators):
+    """Base settings of the norms accepting only the `vmin`, `vmax` and `clip` arguments."""
+
+    vmin: Optional[float] = None
+    vmax: Optional[float] = None
+    clip: Optional[bool] = False
+
+
+class NormalizeSettings(_VminVmaxClipNormSettings):
+    pass
 
 
 class CategoryNormSettings(BaseModel):
+    _VALID_ARGS: ClassVar[frozenset] = _CATEGORY_NORM_ARGS
+
     labels: list[str]
     first_value: Optional[int] = 0
 
@@ -196,27 +287,32 @@ class CategoryNormSettings(BaseModel):
     def validate_labels(cls, v, values):
         """Validate labels for CategoryNorm."""
         if v is not None:
-            assert isinstance(v, list), "'labels' must be a list."
-            assert len(v) >= 2, "'labels' must have at least two strings"
-            assert all([isinstance(label, str) for label in v]), "'labels' must be a list of strings."
+            if not isinstance(v, list):
+                raise ValueError("'labels' must be a list.")
+            if len(v) < 2:
+                raise ValueError("'labels' must have at least two strings")
+            if not all(isinstance(label, str) for label in v):
+                raise ValueError("'labels' must be a list of strings.")
         return v
 
     @field_validator("first_value")
     def validate_first_value(cls, v, values):
         """Validate first_value for CategoryNorm."""
         if v is not None:
-            assert isinstance(v, int), "'first_value' must be an integer."
+            if not isinstance(v, int):
+                raise ValueError("'first_value' must be an integer.")
         return v
 
     @model_validator(mode="before")
     def check_valid_args(cls, values):
         """Check for no excess parameters in Normalize."""
-        valid_args = {"labels", "first_value"}
-        _check_norm_invalid_args(norm_name="CategoryNorm", args=values.keys(), valid_args=valid_args)
+        _check_norm_invalid_args(norm_name="CategoryNorm", args=values.keys(), valid_args=cls._VALID_ARGS)
         return values
 
 
 class BoundaryNormSettings(BaseModel):
+    _VALID_ARGS: ClassVar[frozenset] = _BOUNDARY_NORM_ARGS
+
     boundaries: list[float]
     clip: Optional[bool] = False
     extend: Optional[str] = "neither"
@@ -225,9 +321,9 @@ class BoundaryNormSettings(BaseModel):
     @field_validator("boundaries")
     def validate_boundaries(cls, v):
         """Validate `boundaries` list for BoundaryNorm."""
-        assert isinstance(v, list), "'boundaries' list is required for 'BoundaryNorm'."
-        assert all(isinstance(b, (int, float)) for b in v), "'boundaries' must be a list of numbers."
-        assert _is_monotonically_increasing(v), "'boundaries' must be monotonically increasing."
+        if not isinstance(v, list):
+            raise ValueError("'boundaries' list is required for 'BoundaryNorm'.")
+        _check_boundaries_values(v)
         return v
 
     @field_validator("clip")
@@ -245,69 +341,51 @@ class BoundaryNormSettings(BaseModel):
 
     @model_validator(mode="before")
     def validate_ncolors(self):
-        """Validate `ncolors` for BoundaryNorm."""
+        """Check for no excess parameters and validate `ncolors` for BoundaryNorm."""
+        _check_norm_invalid_args(
+            norm_name="BoundaryNorm",
+            args=self.keys(),
+            valid_args=BoundaryNormSettings._VALID_ARGS,
+        )
         validated_settings = self
         ncolors = validated_settings.get("ncolors")
-        extend = validated_settings.get("extend")
+        extend = validated_settings.get("extend", "neither")
+        boundaries = validated_settings.get("boundaries", [])
         if ncolors is not None:
-            assert isinstance(ncolors, int), "'ncolors' must be an integer for 'BoundaryNorm'."
-            assert ncolors >= 2, "'ncolors' must be equal or larger than 2."
+            if not isinstance(ncolors, int):
+                raise ValueError("'ncolors' must be an integer for 'BoundaryNorm'.")
+            if ncolors < 2:
+                raise ValueError("'ncolors' must be equal or larger than 2.")
             # - If extend is "neither" (default) there must be equal or larger than len(boundaries) - 1 colors.
             # - If extend is "min" or "max" ncolors must be equal or larger than len(boundaries)
             # - If extend is "both"  ncolors must be equal or larger than len(boundaries) + 1
-            required_ncolors = _get_boundary_norm_expected_ncolors(norm_settings=validated_settings)
+            required_ncolors = _get_boundary_norm_expected_ncolors(boundaries, extend)
             if extend == "neither":
-                assert (
-                    ncolors >= required_ncolors
-                ), f"'ncolors' must be equal or larger than len('boundaries') - 1 ({required_ncolors})."
+                if ncolors < required_ncolors:
+                    raise ValueError(
+                        f"'ncolors' must be equal or larger than len('boundaries') - 1 ({required_ncolors})."
+                    )
             elif extend in ["min", "max"]:
-                assert (
-                    ncolors >= required_ncolors
-                ), f"'ncolors' must be equal or larger than len('boundaries') ({required_ncolors})."
+                if ncolors < required_ncolors:
+                    raise ValueError(f"'ncolors' must be equal or larger than len('boundaries') ({required_ncolors}).")
             elif extend == "both":
-                assert (
-                    ncolors >= required_ncolors
-                ), f"'ncolors' must be equal or larger than len('boundaries') + 1 ({required_ncolors})."
+                if ncolors < required_ncolors:
+                    raise ValueError(
+                        f"'ncolors' must be equal or larger than len('boundaries') + 1 ({required_ncolors})."
+                    )
         else:
-            ncolors = _get_boundary_norm_expected_ncolors(norm_settings=validated_settings)
+            ncolors = _get_boundary_norm_expected_ncolors(boundaries, extend)
         self.update({"ncolors": ncolors})
         return self
 
-    @model_validator(mode="before")
-    def check_valid_args(cls, values):
-        """Check for no excess parameters in BoundaryNorm."""
-        valid_args = {"boundaries", "ncolors", "clip", "extend"}
-        _check_norm_invalid_args(norm_name="BoundaryNorm", args=values.keys(), valid_args=valid_args)
-        return values
-
 
-class NoNormSettings(BaseModel):
-    vmin: Optional[float] = None
-    vmax: Optional[float] = None
-    clip: Optional[bool] = False
-
-    @field_validator("clip")
-    def validate_clip(cls, v):
-        """Validate `clip` option for NoNorm."""
-        _check_clip(v)
-        return v
-
-    @model_validator(mode="before")
-    def check_vmin_vmax(cls, values):
-        """Check `vmin` and `vmax` for NoNorm."""
-        vmin, vmax = values.get("vmin"), values.get("vmax")
-        _check_vmin_vmax(vmin, vmax)
-        return values
-
-    @model_validator(mode="before")
-    def check_valid_args(cls, values):
-        """Check for no excess parameters in NoNorm."""
-        valid_args = {"vmin", "vmax", "clip"}
-        _check_norm_invalid_args(norm_name="NoNorm", args=values.keys(), valid_args=valid_args)
-        return values
+class NoNormSettings(_VminVmaxClipNormSettings):
+    _NORM_NAME: ClassVar[str] = "NoNorm"
 
 
 class CenteredNormSettings(BaseModel):
+    _VALID_ARGS: ClassVar[frozenset] = _CENTERED_NORM_ARGS
+
     vcenter: Optional[Union[int, float]] = 0
     halfrange: Optional[Union[int, float]] = None
     clip: Optional[bool] = False
@@ -321,25 +399,28 @@ class CenteredNormSettings(BaseModel):
     @field_validator("vcenter")
     def validate_vcenter(cls, v):
         """Validate `vcenter` for CenteredNorm."""
-        assert isinstance(v, (int, float)), "'vcenter' must be an integer or float."
+        if not isinstance(v, _NUMBER_TYPES):
+            raise ValueError("'vcenter' must be an integer or float.")
         return v
 
     @field_validator("halfrange")
     def validate_halfrange(cls, v):
         """Validate `halfrange` for CenteredNorm."""
         if v is not None:
-            assert isinstance(v, (int, float)), "'halfrange' must be an integer, float or None."
+            if not isinstance(v, _NUMBER_TYPES):
+                raise ValueError("'halfrange' must be an integer, float or None.")
         return v
 
     @model_validator(mode="before")
     def check_valid_args(cls, values):
         """Check for no excess parameters in CenteredNorm."""
-        valid_args = {"vcenter", "halfrange", "clip"}
-        _check_norm_invalid_args(norm_name="CenteredNorm", args=values.keys(), valid_args=valid_args)
+        _check_norm_invalid_args(norm_name="CenteredNorm", args=values.keys(), valid_args=cls._VALID_ARGS)
         return values
 
 
 class TwoSlopeNormSettings(BaseModel):
+    _VALID_ARGS: ClassVar[frozenset] = _TWO_SLOPE_NORM_ARGS
+
     vcenter: float
     vmin: Optional[float] = None
     vmax: Optional[float] = None
@@ -347,54 +428,34 @@ class TwoSlopeNormSettings(BaseModel):
     @field_validator("vcenter")
     def validate_vcenter(cls, v):
         """Validate `vcenter` for TwoSlopeNorm."""
-        assert isinstance(v, (int, float)), "'vcenter' must be an integer or float."
+        if not isinstance(v, _NUMBER_TYPES):
+            raise ValueError("'vcenter' must be an integer or float.")
         return v
 
     @model_validator(mode="before")
-    def check_vmin_vcenter_vmax(cls, values):
-        """Check `vmin`, `vcenter`, and `vmax` for TwoSlopeNorm."""
+    def check_settings(cls, values):
+        """Check for no excess parameters and check `vmin`, `vcenter`, and `vmax` for TwoSlopeNorm."""
+        _check_norm_invalid_args(norm_name="TwoSlopeNorm", args=values.keys(), valid_args=cls._VALID_ARGS)
         vmin, vcenter, vmax = values.get("vmin"), values.get("vcenter"), values.get("vmax")
         _check_vmin_vcenter_vmax(vmin=vmin, vcenter=vcenter, vmax=vmax, norm_name="TwoSlopeNorm")
         return values
 
-    @model_validator(mode="before")
-    def check_valid_args(cls, values):
-        """Check for no excess parameters in TwoSlopeNorm."""
-        valid_args = {"vcenter", "vmin", "vmax"}
-        _check_norm_invalid_args(norm_name="TwoSlopeNorm", args=values.keys(), valid_args=valid_args)
-        return values
 
+class LogNormSettings(_VminVmaxClipNormSettings):
+    _NORM_NAME: ClassVar[str] = "LogNorm"
 
-class LogNormSettings(BaseModel):
-    vmin: Optional[float] = None
-    vmax: Optional[float] = None
-    clip: Optional[bool] = False
-
-    @field_validator("clip")
-    def validate_clip(cls, v):
-        """Validate `clip` option for LogNorm."""
-        _check_clip(v)
+    @field_validator("vmin")
+    def validate_vmin(cls, v):
+        """Validate `vmin` for LogNorm."""
+        if v is not None and v <= 0:
+            raise ValueError("LogNorm vmin should be a positive value.")
         return v
 
-    @model_validator(mode="before")
-    def check_vmin_vmax(cls, values):
-        """Check `vmin` and `vmax` for LogNorm."""
-        vmin, vmax = values.get("vmin"), values.get("vmax")
-        _check_vmin_vmax(vmin, vmax)
-        if vmin is not None:
-            if vmin <= 0:
-                raise ValueError("LogNorm vmin should be a positive value.")
-        return values
-
-    @model_validator(mode="before")
-    def check_valid_args(cls, values):
-        """Check for no excess parameters in LogNorm."""
-        valid_args = {"vmin", "vmax", "clip"}
-        _check_norm_invalid_args(norm_name="LogNorm", args=values.keys(), valid_args=valid_args)
-        return values
 
+class SymLogNormSettings(_VminVmaxClipNormValidators):
+    _NORM_NAME: ClassVar[str] = "SymLogNorm"
+    _VALID_ARGS: ClassVar[frozenset] = _SYMLOG_NORM_ARGS
 
-class SymLogNormSettings(BaseModel):
     linthresh: float
     linscale: Optional[float] = 1.0
     base: Optional[float] = 10
@@ -405,38 +466,23 @@ class SymLogNormSettings(BaseModel):
     @field_validator("linthresh")
     def validate_linthresh(cls, v):
         """Validate `linthresh` for SymLogNorm."""
-        assert v > 0, "'linthresh' must be positive for 'SymLogNorm'."
+        if v <= 0:
+            raise ValueError("'linthresh' must be positive for 'SymLogNorm'.")
         return v
 
     @field_validator("linscale", "base")
     def validate_linscale_base(cls, v, field):
         """Validate `linscale` and `base` for SymLogNorm."""
         if v is not None:
-            assert v > 0, f"'{field.name}' must be positive for 'SymLogNorm'."
+            if v <= 0:
+                raise ValueError(f"'{field.name}' must be positive for 'SymLogNorm'.")
         return v
 
-    @field_validator("clip")
-    def validate_clip(cls, v):
-        """Validate `clip` option for SymLogNorm."""
-        _check_clip(v)
-        return v
 
-    @model_validator(mode="before")
-    def check_vmin_vmax(cls, values):
-        """Check `vmin` and `vmax` for SymLogNorm."""
-        vmin, vmax = values.get("vmin"), values.get("vmax")
-        _check_vmin_vmax(vmin, vmax)
-        return values
-
-    @model_validator(mode="before")
-    def check_valid_args(cls, values):
-        """Check for no excess parameters in SymLogNorm."""
-        valid_args = ["linthresh", "linscale", "vmin", "vmax", "clip", "base"]
-        _check_norm_invalid_args(norm_name="SymLogNorm", args=values.keys(), valid_args=valid_args)
-        return values
+class PowerNormSettings(_VminVmaxClipNormValidators):
+    _NORM_NAME: ClassVar[str] = "PowerNorm"
+    _VALID_ARGS: ClassVar[frozenset] = _POWER_NORM_ARGS
 
-
-class PowerNormSettings(BaseModel):
     gamma: float
     vmin: Optional[float] = None
     vmax: Optional[float] = None
@@ -445,31 +491,15 @@ class PowerNormSettings(BaseModel):
     @field_validator("gamma")
     def validate_gamma(cls, v):
         """Validate `gamma` for PowerNorm."""
-        assert isinstance(v, (int, float)), "'gamma' must be an integer or float."
-        return v
-
-    @field_validator("clip")
-    def validate_clip(cls, v):
-        """Validate `clip` option for PowerNorm."""
-        _check_clip(v)
+        if not isinstance(v, _NUMBER_TYPES):
+            raise ValueError("'gamma' must be an integer or float.")
         return v
 
-    @model_validator(mode="before")
-    def check_vmin_vmax(cls, values):
-        """Check `vmin` and `vmax` for PowerNorm."""
-        vmin, vmax = values.get("vmin"), values.get("vmax")
-        _check_vmin_vmax(vmin, vmax)
-        return values
 
-    @model_validator(mode="before")
-    def check_valid_args(cls, values):
-        """Check for no excess parameters in PowerNorm."""
-        valid_args = ["gamma", "vmin", "vmax", "clip"]
-        _check_norm_invalid_args(norm_name="PowerNorm", args=values.keys(), valid_args=valid_args)
-        return values
+class AsinhNormSettings(_VminVmaxClipNormValidators):
+    _NORM_NAME: ClassVar[str] = "AsinhNorm"
+    _VALID_ARGS: ClassVar[frozenset] = _ASINH_NORM_ARGS
 
-
-class AsinhNormSettings(BaseModel):
     linear_width: Optional[Union[int, float]] = 1
     vmin: Optional[float] = None
     vmax: Optional[float] = None
@@ -478,69 +508,45 @@ class AsinhNormSettings(BaseModel):
     @field_validator("linear_width")
     def validate_linear_width(cls, v):
         """Validate `linear_width` for AsinhNorm."""
-        assert isinstance(v, (int, float)), "'linear_width' must be an integer or float."
+        if not isinstance(v, _NUMBER_TYPES):
+            raise ValueError("'linear_width' must be an integer or float.")
         return v
 
-    @field_validator("clip")
-    def validate_clip(cls, v):
-        """Validate `clip` option for AsinhNorm."""
-        _check_clip(v)
-        return v
 
-    @model_validator(mode="before")
-    def check_vmin_vmax(cls, values):
-        """Check `vmin` and `vmax` for AsinhNorm."""
-        vmin, vmax = values.get("vmin"), values.get("vmax")
-        _check_vmin_vmax(vmin, vmax)
-        return values
+# Mapping of the *Norm names to their settings validator
+_NORM_SETTINGS_MAPPING = {
+    "Norm": NormalizeSettings,
+    "NoNorm": NoNormSettings,
+    "BoundaryNorm": BoundaryNormSettings,
+    "TwoSlopeNorm": TwoSlopeNormSettings,
+    "CenteredNorm": CenteredNormSettings,
+    "LogNorm": LogNormSettings,
+    "SymLogNorm": SymLogNormSettings,
+    "PowerNorm": PowerNormSettings,
+    "AsinhNorm": AsinhNormSettings,
+    "CategoryNorm": CategoryNormSettings,
+}
 
-    @model_validator(mode="before")
-    def check_valid_args(cls, values):
-        """Check for no excess parameters in AsinhNorm."""
-        valid_args = ["linear_width", "vmin", "vmax", "clip"]
-        _check_norm_invalid_args(norm_name="AsinhNorm", args=values.keys(), valid_args=valid_args)
-        return values
+
+# Valid *Norm names
+_VALID_NORM_NAMES = frozenset(_NORM_SETTINGS_MAPPING)
 
 
 def _check_valid_norm_name(name):
-    valid_names = [
-        "Norm",
-        "NoNorm",
-        "BoundaryNorm",
-        "TwoSlopeNorm",
-        "CenteredNorm",
-        "LogNorm",
-        "SymLogNorm",
-        "PowerNorm",
-        "AsinhNorm",
-        "CategoryNorm",
-    ]
-    if name not in valid_names:
-        raise ValueError(f"Invalid norm '{name}'. Valid options are {valid_names}.")
+    if name not in _VALID_NORM_NAMES:
+        raise ValueError(f"Invalid norm '{name}'. Valid options are {list(_NORM_SETTINGS_MAPPING)}.")
 
 
 def check_norm_settings(norm_settings):
     # Check valid *Norm name
-    norm_settings = norm_settings.copy()
-    name = norm_settings.pop("name", "Norm")
-    _check_valid_norm_name(name)
-    # Define *Norm validators
-    norm_settings_mapping = {
-        "Norm": NormalizeSettings,
-        "NoNorm": NoNormSettings,
-        "BoundaryNorm": BoundaryNormSettings,
-        "TwoSlopeNorm": TwoSlopeNormSettings,
-        "CenteredNorm": CenteredNormSettings,
-        "LogNorm": LogNormSettings,
-        "SymLogNorm": SymLogNormSettings,
-        "PowerNorm": PowerNormSettings,
-        "AsinhNorm": AsinhNormSettings,
-        "CategoryNorm": CategoryNormSettings,
-    }
+    name = norm_settings.get("name", "Norm")
     # Retrieve NormSettings Validator
-    validator = norm_settings_mapping[name]
-    # Validate settings
-    norm_settings = validator(**norm_settings).model_dump()
+    validator = _NORM_SETTINGS_MAPPING.get(name)
+    if validator is None:
+        _check_valid_norm_name(name)
+    # Validate settings (without modifying the input dictionary)
+    norm_kwargs = {key: value for key, value in norm_settings.items() if key != "name"}
+    norm_settings = validator(**norm_kwargs).model_dump()
     # Return validated settings (adding back the name !)
     norm_settings["name"] = name
     return norm_settings
@@ -571,64 +577,70 @@ class ColorbarSettings(BaseModel):
         """Validate extend fraction."""
         if v is not None:
             if isinstance(v, list):
-                assert all(
-                    isinstance(frac, (float, int)) and 0 <= frac <= 1 for frac in v
-                ), "Each extendfrac in the list must be a float or int between 0 and 1."
+                if not all(isinstance(frac, _NUMBER_TYPES) and 0 <= frac <= 1 for frac in v):
+                    raise ValueError("Each extendfrac in the list must be a float or int between 0 and 1.")
             elif isinstance(v, str):
-                assert v == "auto", "'extendfrac' must not be a string."
+                if v != "auto":
+                    raise ValueError("'extendfrac' must not be a string.")
             else:
-                assert isinstance(v, (float, int)) and 0 <= v <= 1, "extendfrac must be a float or int between 0 and 1."
+                if not (isinstance(v, _NUMBER_TYPES) and 0 <= v <= 1):
+                    raise ValueError("extendfrac must be a float or int between 0 and 1.")
         return v
 
     @field_validator("extendrect")
     def validate_extendrect(cls, v):
         """Validate extend rectangle option."""
         if v is not None:
-            assert isinstance(v, bool), "extendrect must be a boolean value."
+            if not isinstance(v, bool):
+                raise ValueError("extendrect must be a boolean value.")
         return v
 
     @field_validator("label")
     def validate_label(cls, v):
         """Validate label as string."""
         if v is not None:
-            assert isinstance(v, str), "label must be a string."
+            if not isinstance(v, str):
+                raise ValueError("label must be a string.")
         return v
 
 
 ####-------------------------------------------------------------------------------------------------------------------.
 
 
+# Valid keys of a colorbar dictionary referencing another colorbar
+_REFERENCE_KEYS = frozenset(("reference", "auxiliary"))
+
+
 def resolve_colorbar_reference(cbar_dict, name, checked_references=None):
-    import pycolorbar
+    pycolorbar = _get_pycolorbar()
+    checked_references = set() if checked_references is None else set(checked_references)
 
-    keys = list(cbar_dict)
-    if len(keys) > 1:
-        if np.any(np.isin(keys, ["auxiliary", "reference"], invert=True)):
+    # Visit the chain of references until a colorbar dictionary without reference is found
+    while True:
+        if not _REFERENCE_KEYS.issuperset(cbar_dict):
             raise ValueError("If referencing another colorbar, only 'reference' and 'auxiliary' keys are allowed.")
 
-    # Retrieve reference
-    reference_name = cbar_dict["reference"]
+        # Retrieve reference
+        reference_name = cbar_dict["reference"]
 
-    # Check reference is available
-    if reference_name not in pycolorbar.colorbars.names:
-        raise ValueError(f"The '{reference_name}' colorbar is not registered in pycolorbar. Invalid reference !")
+        # Check reference is available
+        if reference_name not in pycolorbar.colorbars.names:
+            raise ValueError(f"The '{reference_name}' colorbar is not registered in pycolorbar. Invalid reference !")
 
-    # Check for circular references
-    if checked_references is None:
-        checked_references = []
-    if reference_name in checked_references:
-        raise ValueError(f"Circular reference detected with '{reference_name}'.")
+        # Check for circular references
+        if reference_name in checked_references:
+            raise ValueError(f"Circular reference detected with '{reference_name}'.")
 
-    # Retrieve new dictionary
-    cbar_ref_dict = pycolorbar.colorbars.get_cbar_dict(reference_name, validate=False)
+        # Retrieve new dictionary
+        cbar_ref_dict = pycolorbar.colorbars.get_cbar_dict(reference_name, validate=False)
 
-    # If another reference, visit recursively the references
-    if "reference" in cbar_ref_dict:
-        checked_references.append(name)
-        return resolve_colorbar_reference(cbar_ref_dict, name=reference_name, checked_references=checked_references)
+        # Return the original colorbar dictionary
+        if "reference" not in cbar_ref_dict:
+            return cbar_ref_dict
 
-    # Return the original colorbar dictionary
-    return cbar_ref_dict
+        # Otherwise continue with the next reference
+        checked_references.add(name)
+        cbar_dict, name = cbar_ref_dict, reference_name
 
 
 def _check_discrete_norm_cmap_settings(cmap_settings, norm_settings):
@@ -641,7 +653,7 @@ def _check_discrete_norm_cmap_settings(cmap_settings, norm_settings):
     if norm == "CategoryNorm":
         expected_ncolors = len(norm_settings["labels"])
     else:  # "BoundaryNorm"
-        expected_ncolors = _get_boundary_norm_expected_ncolors(norm_settings=norm_settings)
+        expected_ncolors = _get_boundary_norm_expected_ncolors(norm_settings["boundaries"], norm_settings["extend"])
 
     n = cmap_settings.get("n", None)
     # If n is specified, check is consistent
@@ -649,14 +661,18 @@ def _check_discrete_norm_cmap_settings(cmap_settings, norm_settings):
         # Check it match expectations
         # - Single Colormap
         if isinstance(n, int):
-            assert (
-                n == expected_ncolors
-            ), f"'n' is optional and must be {expected_ncolors} for the specified discrete norm."
+            if n != expected_ncolors:
+                raise ValueError(f"'n' is optional and must be {expected_ncolors} for the specified discrete norm.")
         # - Multiple colormaps
         else:
-            assert (
-                sum(n) == expected_ncolors
-            ), f"The sum of 'n' must be {expected_ncolors} for the specified discrete norm."
+            # Stop summing as soon as the expected number of colors is exceeded
+            total_ncolors = 0
+            for ncolors in n:
+                total_ncolors += ncolors
+                if total_ncolors > expected_ncolors:
+                    break
+            if total_ncolors != expected_ncolors:
+                raise ValueError(f"The sum of 'n' must be {expected_ncolors} for the specified discrete norm.")
     # Else specify the expected value
     else:
         n = expected_ncolors
@@ -665,62 +681,117 @@ def _check_discrete_norm_cmap_settings(cmap_settings, norm_settings):
 
 
 def validate_cbar_dict(cbar_dict: dict, name: str, resolve_reference=False):
-    """Validate a colorbar dictionary."""
+    """Validate a colorbar dictionary.
+
+    The input dictionary is not modified and a new dictionary is always returned.
+    """
     # Raise error for empty dictionary or wrong type
     if not isinstance(cbar_dict, dict):
         raise TypeError("The colorbar dictionary must be a dictionary.")
     if len(cbar_dict) == 0:
         raise ValueError("The colorbar dictionary can not be empty.")
-    # Copy the dictionary before modifying it
-    cbar_dict = cbar_dict.copy()
     # Check if cbar_dict reference to another colorbar settings
     if "reference" in cbar_dict:
         referenced_cbar_dict = resolve_colorbar_reference(cbar_dict, name=name)
         if resolve_reference:
             cbar_dict = referenced_cbar_dict
         else:
-            return cbar_dict
-
+            # A shallow copy is returned, so that the caller can store it without aliasing the input dictionary
+            return cbar_dict.copy()
+
+    # Validate the colorbar settings
+    # - The validation of already validated settings is retrieved from the cache
+    # - The cache is used only if the colormaps are currently available
+    #   (as this is the only check depending on the state of the colormaps registries)
+    if _are_cmap_names_available(cbar_dict):
+        try:
+            frozen_cbar_dict = _freeze(cbar_dict)
+        except TypeError:  # unhashable values
+            frozen_cbar_dict = None
+        if frozen_cbar_dict is not None:
+            return copy.deepcopy(_validate_frozen_cbar_settings(frozen_cbar_dict))
+    return _validate_cbar_settings(cbar_dict)
+
+
+def _freeze(obj):
+    """Convert a (nested) colorbar dictionary into an hashable object.
+
+    The type of each value is included to not confuse values like `1`, `1.0` and `True`.
+    """
+    if isinstance(obj, dict):
+        return (dict, tuple((key, _freeze(value)) for key, value in obj.items()))
+    if isinstance(obj, _SEQUENCE_TYPES):
+        return (type(obj), tuple(_freeze(value) for value in obj))
+    hash(obj)
+    return (type(obj), obj)
+
+
+def _unfreeze(frozen_obj):
+    """Convert back an object frozen by `_freeze`."""
+    obj_type, obj = frozen_obj
+    if obj_type is dict:
+        return {key: _unfreeze(value) for key, value in obj}
+    if obj_type in _SEQUENCE_TYPES:
+        return obj_type(_unfreeze(value) for value in obj)
+    return obj
+
+
+def _are_cmap_names_available(cbar_dict):
+    """Check if the colormap(s) of a colorbar dictionary are available in matplotlib or pycolorbar."""
+    cmap_settings = cbar_dict.get("cmap")
+    names = cmap_settings.get("name") if isinstance(cmap_settings, dict) else None
+    if isinstance(names, str):
+        names = [names]
+    if not isinstance(names, list) or len(names) == 0:
+        return False
+    return all(isinstance(name, str) and _is_valid_cmap_name(name) for name in names)
+
+
+@lru_cache(maxsize=256)
+def _validate_frozen_cbar_settings(frozen_cbar_dict):
+    """Validate the colorbar settings of a frozen colorbar dictionary.
+
+    The returned dictionary is cached and must not be modified.
+    """
+    return _validate_cbar_settings(_unfreeze(frozen_cbar_dict))
+
+
+def _validate_cbar_settings(cbar_dict):
+    """Validate the cmap, norm and cbar settings of a (not referenced) colorbar dictionary."""
     # Retrieve cmap, norm and cbar settings
     cmap_settings = cbar_dict["cmap"]
     norm_settings = cbar_dict.get("norm", {})
     cbar_settings = cbar_dict.get("cbar", {})
 
-    # Test validity
-    invalid_configuration = False
+    # Test validity (collecting the error messages)
+    errors = []
 
     try:
         cmap_settings = ColormapSettings(**cmap_settings).model_dump()
     except Exception as e:
-        invalid_configuration = True
-        print(f"Colormap validation error: {e}")
+        errors.append(f"Colormap validation error: {e}")
 
     try:
         norm_settings = check_norm_settings(norm_settings)
     except Exception as e:
-        invalid_configuration = True
-        print(f"Norm validation error: {e}")
+        errors.append(f"Norm validation error: {e}")
 
     try:
         cbar_settings = ColorbarSettings(**cbar_settings).model_dump()
     except Exception as e:
-        invalid_configuration = True
-        print(f"Colorbar validation error: {e}")
-
-    # Consistency checks
-    try:
-        cmap_settings, norm_settings = _check_discrete_norm_cmap_settings(
-            cmap_settings=cmap_settings, norm_settings=norm_settings
-        )
-    except Exception as e:
-        invalid_configuration = True
-        print(f"Categorical Colormap validation error: {e}")
-
-    if invalid_configuration:
-        raise ValueError("Invalid configuration")
-
-    # Return the validated dictionary
-    cbar_dict["cmap"] = cmap_settings
-    cbar_dict["norm"] = norm_settings
-    cbar_dict["cbar"] = cbar_settings
-    return cbar_dict
+        errors.append(f"Colorbar validation error: {e}")
+
+    # Consistency checks (which require validated settings)
+    if not errors:
+        try:
+            cmap_settings, norm_settings = _check_discrete_norm_cmap_settings(
+                cmap_settings=cmap_settings, norm_settings=norm_settings
+            )
+        except Exception as e:
+            errors.append(f"Categorical Colormap validation error: {e}")
+
+    if errors:
+        raise ValueError("Invalid configuration:\n" + "\n".join(errors))
+
+    # Return the validated dictionary (without modifying the input dictionary)
+    return {**cbar_dict, "cmap": cmap_settings, "norm": norm_settings, "cbar": cbar_settings}
@@ -26,9 +26,10 @@
 # -----------------------------------------------------------------------------.
 """Define functions to visualize univariate colorbars."""
 import math
+import os
+from concurrent.futures import ProcessPoolExecutor
 
 import matplotlib as mpl
-import matplotlib.pyplot as plt
 import numpy as np
 
 
@@ -49,6 +50,8 @@ def _draw_colorbar(plot_kwargs, cbar_kwargs, fig, ax=None, cax=None):
 
 
 def plot_colorbar(plot_kwargs, cbar_kwargs, ax=None, subplot_size=(6, 1)):
+    import matplotlib.pyplot as plt
+
     # Initialize figure if necessary
     if ax is None:
         fig, ax = plt.subplots(figsize=subplot_size, layout="constrained")
@@ -58,6 +61,8 @@ def plot_colorbar(plot_kwargs, cbar_kwargs, ax=None, subplot_size=(6, 1)):
 
 
 def plot_colorbars(list_args, cols=None, subplot_size=None, dpi=200):
+    import matplotlib.pyplot as plt
+
     # Define subplot_size
     if subplot_size is None:
         subplot_size = (5, 1.2)  # 3 --> 2
@@ -78,7 +83,15 @@ def plot_colorbars(list_args, cols=None, subplot_size=None, dpi=200):
     fig_height = rows * subplot_size[1]
 
     # Initialize figure
-    fig, axes = plt.subplots(rows, cols, figsize=(fig_width, fig_height), dpi=dpi)
+    # - The constrained layout is computed at drawing time (and is faster than fig.tight_layout())
+    fig, axes = plt.subplots(
+        rows,
+        cols,
+        figsize=(fig_width, fig_height),
+        dpi=dpi,
+        layout="constrained",
+        squeeze=False,
+    )
 
     # Flatten axes for easy iteration
     axes = axes.ravel()
@@ -89,13 +102,71 @@ def plot_colorbars(list_args, cols=None, subplot_size=None, dpi=200):
         ax.set_title(name, fontsize=10, weight="bold")
     # Turn off any remaining axes
     for ax in axes[n:]:
-        ax.axis("off")
+        ax.set_axis_off()
 
-    fig.tight_layout()
     plt.show()
 
 
-def show_colorbar(name=None, user_plot_kwargs={}, user_cbar_kwargs={}, fig_size=(6, 1)):
+def _export_colorbar(name, plot_kwargs, cbar_kwargs, filepath, subplot_size, dpi):
+    # Use a Figure without pyplot (rendered with the Agg canvas)
+    fig = mpl.figure.Figure(figsize=subplot_size, dpi=dpi, layout="constrained")
+    ax = fig.add_subplot()
+    _ = _draw_colorbar(plot_kwargs=plot_kwargs, cbar_kwargs=cbar_kwargs, fig=fig, ax=None, cax=ax)
+    ax.set_title(name, fontsize=10, weight="bold")
+    fig.savefig(filepath)
+    return filepath
+
+
+def _get_export_filepath(name, directory):
+    # Do not allow names that would write outside the directory
+    separators = [sep for sep in ["/", os.sep, os.altsep] if sep]
+    if name in ["", ".", ".."] or any(sep in name for sep in separators):
+        raise ValueError(f"The colorbar name '{name}' can not be used as a PNG filename.")
+    return os.path.join(directory, f"{name}.png")
+
+
+def save_colorbars(list_args, directory, subplot_size=(6, 1), dpi=200, max_workers=None):
+    """
+    Save colorbars to PNG files, rendering them in parallel processes.
+
+    Parameters
+    ----------
+    list_args : list
+        List of ``(name, plot_kwargs, cbar_kwargs)`` colorbar arguments.
+    directory : str
+        The directory where the ``<name>.png`` files are written.
+    subplot_size : tuple, optional
+        The size of each colorbar figure. The default is ``(6, 1)``.
+    dpi : int, optional
+        The resolution of the PNG files. The default is 200.
+    max_workers : int, optional
+        The maximum number of processes. If `None` (the default), it uses the number of CPUs.
+
+    Returns
+    -------
+    list
+        The file paths of the PNG files.
+    """
+    filepaths = [_get_export_filepath(name=name, directory=directory) for name, _, _ in list_args]
+    os.makedirs(directory, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _export_colorbar,
+                name=name,
+                plot_kwargs=plot_kwargs,
+                cbar_kwargs=cbar_kwargs,
+                filepath=filepath,
+                subplot_size=subplot_size,
+                dpi=dpi,
+            )
+            for (name, plot_kwargs, cbar_kwargs), filepath in zip(list_args, filepaths)
+        ]
+        filepaths = [future.result() for future in futures]
+    return filepaths
+
+
+def show_colorbar(name=None, user_plot_kwargs=None, user_cbar_kwargs=None, fig_size=(6, 1)):
     from pycolorbar import colorbars
 
     colorbars.show_colorbar(
@@ -110,3 +181,16 @@ def show_colorbars(category=None, exclude_referenced=True, subplot_size=None):
     from pycolorbar import colorbars
 
     colorbars.show_colorbars(category=category, exclude_referenced=exclude_referenced, subplot_size=subplot_size)
+
+
+def export_colorbars(directory, category=None, exclude_referenced=True, subplot_size=(6, 1), dpi=200, max_workers=None):
+    from pycolorbar import colorbars
+
+    return colorbars.export_colorbars(
+        directory=directory,
+        category=category,
+        exclude_referenced=exclude_referenced,
+        subplot_size=subplot_size,
+        dpi=dpi,
+        max_workers=max_workers,
+    )
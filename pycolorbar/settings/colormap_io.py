@@ -43,8 +43,10 @@ def _check_presence_required_keys(cmap_dict):
 
 def _ensure_colors_array(colors):
     """Ensure the colors object is a numpy array."""
-    colors = np.asanyarray(colors)
-    return colors
+    # Return numpy arrays as they are (no copy, no dtype conversion)
+    if isinstance(colors, np.ndarray):
+        return colors
+    return np.asarray(colors)
 
 
 def _ensure_colors_list(colors):
@@ -79,6 +81,15 @@ def read_cmap_dict(filepath, decode=True, validate=True):
     return cmap_dict
 
 
+def read_cmap_metadata(filepath):
+    """Read the auxiliary metadata of a pycolorbar colormap YAML file.
+
+    The color palette is not decoded and the colormap dictionary is not validated.
+    """
+    cmap_dict = read_yaml(filepath)
+    return cmap_dict.get("auxiliary", {})
+
+
 def write_cmap_dict(cmap_dict, filepath, force=False, encode=True, validate=True):
     """Write a pycolorbar colormap YAML file.
 
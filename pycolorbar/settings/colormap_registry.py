@@ -26,14 +26,12 @@
 # -----------------------------------------------------------------------------.
 """Define the register of univiariate colormaps."""
 
+import copy
+import functools
 import os
 import tempfile
 
-import matplotlib as mpl
-import matplotlib.pyplot as plt
-import numpy as np
-
-from pycolorbar.settings.colormap_io import read_cmap_dict, write_cmap_dict
+from pycolorbar.settings.colormap_io import read_cmap_dict, read_cmap_metadata, write_cmap_dict
 from pycolorbar.settings.utils import get_auxiliary_categories
 from pycolorbar.utils.yaml import list_yaml_files
 
@@ -63,6 +61,21 @@ class ColormapRegistry:
     tmp_dir : str
         The path of a temporary directory where colormap YAML files are stored when specifying a colormap
         on-the-fly with `add_cmap_dict(cmap_dict)`.
+    _cmap_dict_cache : dict
+        The dictionary holding, for each colormap YAML file path, the file modification time and
+        the validated colormap dictionary read from the file.
+    _sorted_names : list
+        The cached sorted list of the registered colormap names.
+    _names_with_reversed : frozenset
+        The cached set of the registered colormap names, including the names with the `_r` suffix.
+    _categories_index : dict
+        The dictionary holding the (uppercase) auxiliary categories of the registered colormaps.
+        It is filled lazily when subsetting the colormaps by category.
+    _base_cmap_cache : dict
+        The dictionary holding, for each colormap YAML file path, the file modification time and
+        the (not reversed) matplotlib colormap created from the file.
+    _cmap_cache : functools._lru_cache_wrapper
+        The LRU cache of the colormaps built by `get_cmap(name, lut)`.
     """
 
     _instance = None
@@ -74,6 +87,14 @@ class ColormapRegistry:
             cls._instance.registry = {}
             # Create temporary path
             cls._instance.tmp_dir = None
+            # Initialize cache of the validated colormap dictionaries
+            cls._instance._sorted_names = None
+            cls._instance._names_with_reversed = None
+            cls._instance._cmap_dict_cache = {}
+            cls._instance._categories_index = {}
+            # Initialize cache of the colormaps
+            cls._instance._base_cmap_cache = {}
+            cls._instance._cmap_cache = functools.lru_cache(maxsize=256)(cls._instance._build_cmap)
         return cls._instance
 
     @classmethod
@@ -85,15 +106,38 @@ class ColormapRegistry:
     def reset(self):
         """Clears the entire colormap registry."""
         self.registry.clear()
+        self._reset_cache()
+
+    def _reset_cache(self):
+        """Reset the cached information depending on the registered colormaps."""
+        self._sorted_names = None
+        self._names_with_reversed = None
+        self._cmap_dict_cache.clear()
+        self._categories_index.clear()
+        self._base_cmap_cache.clear()
+        self._cmap_cache.cache_clear()
+        # The validated colorbars settings depend on the available colormaps
+        from pycolorbar.settings.colorbar_registry import ColorbarRegistry
+
+        ColorbarRegistry.get_instance()._reset_cache()
 
     @property
     def names(self):
         """List the names of all registered colormaps."""
-        return sorted(list(self.registry))
+        # The cache is reset by _reset_cache() at each registry update
+        if self._sorted_names is None:
+            self._sorted_names = sorted(self.registry)
+        return self._sorted_names.copy()
+
+    def _get_names_with_reversed(self):
+        """Return the set of registered colormap names, including the names with the `_r` suffix."""
+        if self._names_with_reversed is None:
+            self._names_with_reversed = frozenset(self.registry) | {name + "_r" for name in self.registry}
+        return self._names_with_reversed
 
     def __contains__(self, item):
         """Test registration of colormap in the registry."""
-        return item in self.names
+        return item in self.registry
 
     def _check_if_cmap_in_use(self, name, force, verbose):
         if name in self.registry:
@@ -131,6 +175,17 @@ class ColormapRegistry:
         self._check_if_cmap_in_use(name=name, force=force, verbose=verbose)
         # Register
         self.registry[name] = filepath
+        self._reset_cache()
+
+    def _register_many(self, entries, verbose: bool = True, force: bool = True):
+        """Register colormaps from (name, filepath) pairs of existing colormap YAML files."""
+        try:
+            for name, filepath in entries:
+                self._check_if_cmap_in_use(name=name, force=force, verbose=verbose)
+                self.registry[name] = filepath
+        finally:
+            # Reset the cache once (also if some colormaps were registered before an error)
+            self._reset_cache()
 
     def add_cmap_dict(self, cmap_dict: dict, name: str, verbose: bool = True, force=True):
         """
@@ -166,6 +221,7 @@ class ColormapRegistry:
         write_cmap_dict(cmap_dict, filepath=filepath, force=True, validate=True, encode=True)
         # Update registry
         self.registry[name] = filepath
+        self._reset_cache()
 
     def unregister(self, name: str):
         """
@@ -185,6 +241,7 @@ class ColormapRegistry:
             _ = self.registry.pop(name)
         else:
             raise ValueError(f"The colormap {name} is not registered in pycolorbar.")
+        self._reset_cache()
 
     def get_cmap_filepath(self, name: str):
         """
@@ -233,7 +290,14 @@ class ColormapRegistry:
             If the colormap configuration is invalid or cannot be read.
         """
         filepath = self.get_cmap_filepath(name)
-        return read_cmap_dict(filepath, validate=True, decode=True)
+        # Read the YAML file only if not cached or modified since the last read
+        mtime = os.stat(filepath).st_mtime_ns
+        cached = self._cmap_dict_cache.get(filepath)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, read_cmap_dict(filepath, validate=True, decode=True))
+            self._cmap_dict_cache[filepath] = cached
+        # Return a copy to avoid modification of the cached dictionary
+        return copy.deepcopy(cached[1])
 
     def get_cmap(self, name: str):
         """
@@ -256,10 +320,31 @@ class ColormapRegistry:
         """
         from pycolorbar.settings.colormap_utility import create_cmap
 
-        cmap_dict = self.get_cmap_dict(name)
-        cmap = create_cmap(name=name, cmap_dict=cmap_dict)
+        # Create the colormap only if not cached or if the YAML file was modified since the last read
+        filepath = self.get_cmap_filepath(name)
+        mtime = os.stat(filepath).st_mtime_ns
+        cached = self._base_cmap_cache.get(filepath)
+        if cached is None or cached[0] != mtime:
+            base_name = name[:-2] if name.endswith("_r") else name
+            cmap_dict = self.get_cmap_dict(base_name)
+            cached = (mtime, create_cmap(name=base_name, cmap_dict=cmap_dict))
+            self._base_cmap_cache[filepath] = cached
+        # Return a new colormap object (the cached colormap must not be modified)
+        cmap = cached[1]
+        if name.endswith("_r"):
+            return cmap.reversed(name)
+        return cmap.copy()
+
+    def _build_cmap(self, name: str, lut: int = None, mtime: int = None):
+        """Build the colormap returned by `get_cmap(name, lut)`.
+
+        The modification time of the colormap YAML file is only used as cache key.
+        """
+        cmap = self.get_cmap(name)
         if name.endswith("_r"):
-            cmap = cmap.reversed(name)
+            cmap = cmap.reversed()
+        if lut is not None:
+            cmap = cmap.resampled(lut)
         return cmap
 
     def validate(self, name: str = None):
@@ -281,12 +366,13 @@ class ColormapRegistry:
         Invalid colormap configurations are reported.
         """
         if isinstance(name, str):
-            if name not in self.names:
+            if name not in self.registry:
                 raise ValueError(f"{name} is not a registered colormap.")
             names = [name]
 
         else:
-            names = self.names
+            # Sort the registry keys directly, so that entries set without _reset_cache() are also validated
+            names = sorted(self.registry)
 
         # Validate colormaps
         wrong_names = []
@@ -304,17 +390,21 @@ class ColormapRegistry:
     def to_yaml(self, name, filepath, force=False):
         """Write the colormap configuration to a YAML file."""
         cmap_dict = self.get_cmap_dict(name)
-        write_cmap_dict(cmap_dict=cmap_dict, filepath=filepath, force=force)
+        # The colormap dictionary is already validated by get_cmap_dict
+        write_cmap_dict(cmap_dict=cmap_dict, filepath=filepath, force=force, validate=False)
+
+    def _get_categories(self, name):
+        """Return the set of (uppercase) auxiliary categories of a registered colormap."""
+        if name not in self._categories_index:
+            # Only the auxiliary metadata are read (without decoding and validating the color palette)
+            auxiliary = read_cmap_metadata(self.get_cmap_filepath(name))
+            categories = get_auxiliary_categories({"auxiliary": auxiliary})
+            self._categories_index[name] = frozenset(cat.upper() for cat in categories)
+        return self._categories_index[name]
 
     def _get_subset_names(self, category):
-        names = []
-        for name in self.names:
-            cmap_dict = self.get_cmap_dict(name)
-            categories = get_auxiliary_categories(cmap_dict)
-            categories = [cat.upper() for cat in categories]
-            if category.upper() in categories:
-                names.append(name)
-        return names
+        category = category.upper()
+        return [name for name in self.names if category in self._get_categories(name)]
 
     def available(self, category=None, include_reversed=False):
         """List the name of available colormaps for a specific category."""
@@ -376,16 +466,15 @@ def register_colormaps(directory: str, name: str = None, verbose: bool = True, f
     """
     colormaps = ColormapRegistry.get_instance()
 
-    # List the colormap YAML files to register
+    # Register a specific colormap YAML file
     if name is not None:
-        filepaths = [os.path.join(directory, f"{name}.yaml")]
-    else:
-        # List all YAML files in the directory
-        filepaths = list_yaml_files(directory)
+        colormaps.register(os.path.join(directory, f"{name}.yaml"), verbose=verbose, force=force)
+        return
 
-    # Add colormaps to the ColormapRegistry
-    for filepath in filepaths:
-        colormaps.register(filepath, verbose=verbose, force=force)
+    # Add all YAML files in the directory to the ColormapRegistry
+    # - The listed files exist and the colormap name is the filename without the '.yaml' extension
+    entries = [(os.path.basename(filepath)[:-5], filepath) for filepath in list_yaml_files(directory)]
+    colormaps._register_many(entries, verbose=verbose, force=force)
 
 
 def register_colormap(filepath: str, verbose: bool = True, force: bool = True):
@@ -453,6 +542,9 @@ def get_cmap(name: str = None, lut: int = None):
     -------
     Colormap
     """
+    import matplotlib as mpl
+    import matplotlib.pyplot as plt
+
     colormaps = ColormapRegistry.get_instance()
 
     # Use default matplotlib colormap
@@ -463,26 +555,19 @@ def get_cmap(name: str = None, lut: int = None):
     if isinstance(name, mpl.colors.Colormap):
         return name
 
-    # Retrieve registered colormaps names
-    pycolorbar_registered_names = colormaps.names + [s + "_r" for s in colormaps.names]
-    mpl_registered_names = plt.colormaps()
-
-    # Check if reversed colormap
-    has_r_suffix = name.endswith("_r")
     # Pycolorbar colormap
-    if name in pycolorbar_registered_names:
-        cmap = colormaps.get_cmap(name)
-        if has_r_suffix:
-            cmap = cmap.reversed()
-        if lut is not None:
-            cmap = cmap.resampled(lut)
-        return cmap
+    if name in colormaps._get_names_with_reversed():
+        # Return a copy as the colormap can be modified in place (i.e. set_bad)
+        mtime = os.stat(colormaps.get_cmap_filepath(name)).st_mtime_ns
+        return colormaps._cmap_cache(name, lut, mtime).copy()
 
     # Matplotlib registered colormap
-    if name in mpl_registered_names:
+    if name in mpl.colormaps:
         return plt.get_cmap(name=name, lut=lut)
     # Unavailable colormap
     else:
+        pycolorbar_registered_names = colormaps.names + [s + "_r" for s in colormaps.names]
+        mpl_registered_names = plt.colormaps()
         raise ValueError(
             f"{name} is not registered in pycolorbar and matplotlib !\n "
             f"Valid matplotlib colormap are {mpl_registered_names}.\n "
@@ -490,94 +575,95 @@ def get_cmap(name: str = None, lut: int = None):
         )
 
 
+# Matplotlib colormap names by category
+_MPL_CMAPS_BY_CATEGORY = {
+    "PERCEPTUAL": ["viridis", "plasma", "inferno", "magma", "cividis"],  # PERCEPTUALLY UNIFORM
+    "SEQUENTIAL": [
+        "viridis",
+        "plasma",
+        "inferno",
+        "magma",
+        "cividis",
+        "Greys",
+        "Purples",
+        "Blues",
+        "Greens",
+        "Oranges",
+        "Reds",
+        "YlOrBr",
+        "YlOrRd",
+        "OrRd",
+        "PuRd",
+        "RdPu",
+        "BuPu",
+        "GnBu",
+        "PuBu",
+        "YlGnBu",
+        "PuBuGn",
+        "BuGn",
+        "YlGn",
+        "binary",
+        "gist_yarg",
+        "gist_gray",
+        "gray",
+        "bone",
+        "pink",
+        "spring",
+        "summer",
+        "autumn",
+        "winter",
+        "cool",
+        "Wistia",
+        "hot",
+        "afmhot",
+        "gist_heat",
+        "copper",
+    ],
+    "DIVERGING": [
+        "PiYG",
+        "PRGn",
+        "BrBG",
+        "PuOr",
+        "RdGy",
+        "RdBu",
+        "RdYlBu",
+        "RdYlGn",
+        "Spectral",
+        "coolwarm",
+        "bwr",
+        "seismic",
+    ],
+    "QUALITATIVE": [
+        "Pastel1",
+        "Pastel2",
+        "Paired",
+        "Accent",
+        "Dark2",
+        "Set1",
+        "Set2",
+        "Set3",
+        "tab10",
+        "tab20",
+        "tab20b",
+        "tab20c",
+    ],
+    "CYCLIC": ["twilight", "twilight_shifted", "hsv"],
+}
+_MPL_CMAPS_BY_CATEGORY["CATEGORICAL"] = _MPL_CMAPS_BY_CATEGORY["QUALITATIVE"]
+
+
 def _get_mpl_cmap_by_category(category):
     """Return matplotlib colormap names by category.
 
     See: https://matplotlib.org/stable/users/explain/colors/colormaps.html#choosing-colormaps
     """
-    type_dict = {
-        "PERCEPTUAL": ["viridis", "plasma", "inferno", "magma", "cividis"],  # PERCEPTUALLY UNIFORM
-        "SEQUENTIAL": [
-            "viridis",
-            "plasma",
-            "inferno",
-            "magma",
-            "cividis",
-            "Greys",
-            "Purples",
-            "Blues",
-            "Greens",
-            "Oranges",
-            "Reds",
-            "YlOrBr",
-            "YlOrRd",
-            "OrRd",
-            "PuRd",
-            "RdPu",
-            "BuPu",
-            "GnBu",
-            "PuBu",
-            "YlGnBu",
-            "PuBuGn",
-            "BuGn",
-            "YlGn",
-            "binary",
-            "gist_yarg",
-            "gist_gray",
-            "gray",
-            "bone",
-            "pink",
-            "spring",
-            "summer",
-            "autumn",
-            "winter",
-            "cool",
-            "Wistia",
-            "hot",
-            "afmhot",
-            "gist_heat",
-            "copper",
-        ],
-        "DIVERGING": [
-            "PiYG",
-            "PRGn",
-            "BrBG",
-            "PuOr",
-            "RdGy",
-            "RdBu",
-            "RdYlBu",
-            "RdYlGn",
-            "Spectral",
-            "coolwarm",
-            "bwr",
-            "seismic",
-        ],
-        "QUALITATIVE": [
-            "Pastel1",
-            "Pastel2",
-            "Paired",
-            "Accent",
-            "Dark2",
-            "Set1",
-            "Set2",
-            "Set3",
-            "tab10",
-            "tab20",
-            "tab20b",
-            "tab20c",
-        ],
-        "CYCLIC": ["twilight", "twilight_shifted", "hsv"],
-    }
-    type_dict["CATEGORICAL"] = type_dict["QUALITATIVE"]
-    if category.upper() in type_dict:
-        names = type_dict[category.upper()]
-    else:
-        names = []
-    return names
+    return list(_MPL_CMAPS_BY_CATEGORY.get(category.upper(), []))
 
 
 def _get_matplotlib_cmaps(category=None, include_reversed=False):
     if category is None:
+        import matplotlib.pyplot as plt
+
         names = plt.colormaps()
         names = [name for name in names if not name.endswith("_r")]
     else:
@@ -612,7 +698,7 @@ def available_colormaps(category=None, include_reversed=False):
     colormaps = ColormapRegistry.get_instance()
     names = colormaps.available(category=category, include_reversed=include_reversed)
     names += _get_matplotlib_cmaps(category=category, include_reversed=include_reversed)
-    names = sorted(np.unique(names))
+    names = sorted(set(names))
     return names
 
 
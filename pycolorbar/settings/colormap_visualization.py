@@ -28,11 +28,12 @@
 import math
 
 import matplotlib as mpl
-import matplotlib.pyplot as plt
 import numpy as np
 
 
 def plot_colormap(cmap, dpi=200):
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(figsize=(4, 0.4), dpi=dpi)
     mpl.colorbar.ColorbarBase(ax, cmap=cmap, orientation="horizontal")
     ax.set_title(cmap.name, fontsize=10, weight="bold")
@@ -40,6 +41,8 @@ def plot_colormap(cmap, dpi=200):
 
 
 def plot_colormaps(cmaps, cols=None, subplot_size=None, dpi=200):
+    import matplotlib.pyplot as plt
+
     # Define subplot_size
     if subplot_size is None:
         subplot_size = (2, 0.5)
@@ -27,7 +27,6 @@
 """Define functions to retrieve the plotting arguments."""
 
 import matplotlib as mpl
-import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.colors import (
     AsinhNorm,
@@ -275,10 +274,10 @@ def _get_ticks_settings(cbar_dict, norm=None):
 def update_plot_cbar_kwargs(default_plot_kwargs, default_cbar_kwargs, user_plot_kwargs=None, user_cbar_kwargs=None):
 
     # If no user kwargs, return default kwargs
+    if not user_plot_kwargs and not user_cbar_kwargs:
+        return default_plot_kwargs, default_cbar_kwargs
     user_plot_kwargs = {} if user_plot_kwargs is None else user_plot_kwargs
     user_cbar_kwargs = {} if user_cbar_kwargs is None else user_cbar_kwargs
-    if user_plot_kwargs == {} and user_cbar_kwargs == {}:
-        return default_plot_kwargs, default_cbar_kwargs
 
     # If user cmap
     # - is a string, retrieve colormap
@@ -434,6 +433,8 @@ def _create_boundary_norm_from_levels(user_plot_kwargs, default_plot_kwargs):
         user_plot_kwargs["cmap"] = user_plot_kwargs["cmap"].resampled(ncolors)
     else:
         if default_plot_kwargs.get("cmap", None) is None:
+            import matplotlib.pyplot as plt
+
             default_plot_kwargs["cmap"] = plt.get_cmap()
         default_plot_kwargs["cmap"] = default_plot_kwargs["cmap"].resampled(ncolors)
     # Add "BoundaryNorm" to user_plot_kwargs
@@ -108,6 +108,31 @@ class TestColorbarRegistry:
         with pytest.raises(ValueError):
             colorbar_registry.register(filepath=colorbar_test_filepath, force=False)
 
+    def test_register_validate_same_file_reference(self, colorbar_registry, tmp_path):
+        """Test registering with validation a YAML file where a colorbar references another one of the file."""
+        filepath = tmp_path / "same_file_reference.yaml"
+        cbar_dicts = {
+            "TEST_REFERENCE_CBAR": {"reference": "TEST_CBAR"},
+            "TEST_CBAR": {"cmap": {"name": "viridis"}},
+        }
+        write_yaml(cbar_dicts, filepath)
+        colorbar_registry.register(filepath, validate=True)
+        assert colorbar_registry.names == ["TEST_CBAR", "TEST_REFERENCE_CBAR"]
+        assert colorbar_registry.get_cbar_dict("TEST_REFERENCE_CBAR") == colorbar_registry.get_cbar_dict("TEST_CBAR")
+
+        # Test the registry is restored if a colorbar is invalid
+        invalid_filepath = tmp_path / "invalid_reference.yaml"
+        invalid_cbar_dicts = {
+            "TEST_CBAR": {"cmap": {"name": "plasma"}},
+            "TEST_NEW_CBAR": {"cmap": {"name": "viridis"}},
+            "TEST_INVALID_REFERENCE_CBAR": {"reference": "INEXISTENT_CBAR"},
+        }
+        write_yaml(invalid_cbar_dicts, invalid_filepath)
+        with pytest.raises(ValueError):
+            colorbar_registry.register(invalid_filepath, validate=True)
+        assert colorbar_registry.names == ["TEST_CBAR", "TEST_REFERENCE_CBAR"]
+        assert colorbar_registry.get_cbar_dict("TEST_CBAR")["cmap"]["name"] == "viridis"
+
     def test_unregister_inexisting_cmap(self, colorbar_registry):
         """Test unregister an inexisting colormap."""
         name = "inexisting_colorbar"
@@ -156,6 +181,28 @@ class TestColorbarRegistry:
         with pytest.raises(ValueError):
             colorbar_registry.get_cbar_dict("inexistent")
 
+    def test_get_cbar_dict_cache(self, colorbar_registry):
+        """Test get_cbar_dict returns copies of the cached dictionary and the cache is updated."""
+        colorbar_registry.add_cbar_dict({"cmap": {"name": "viridis"}}, name="TEST_CBAR")
+        cbar_dict = colorbar_registry.get_cbar_dict("TEST_CBAR")
+        # Test modifying the returned dictionary does not alter the cache
+        cbar_dict["cmap"]["name"] = "inferno"
+        assert colorbar_registry.get_cbar_dict("TEST_CBAR")["cmap"]["name"] == "viridis"
+        # Test the cache is updated when the colorbar is overwritten
+        colorbar_registry.add_cbar_dict({"cmap": {"name": "inferno"}}, name="TEST_CBAR", verbose=False)
+        assert colorbar_registry.get_cbar_dict("TEST_CBAR")["cmap"]["name"] == "inferno"
+
+    def test_get_cbar_dict_cache_colormap_update(self, colorbar_registry):
+        """Test the cached colorbar dictionaries are reset when the colormaps registry is updated."""
+        cmap_dict = {"colormap_type": "ListedColormap", "color_palette": ["#ff0000", "#0000ff"], "color_space": "hex"}
+        pycolorbar.colormaps.add_cmap_dict(cmap_dict=cmap_dict, name="TEST_CMAP")
+        colorbar_registry.add_cbar_dict(cbar_dict={"cmap": {"name": "TEST_CMAP"}}, name="TEST_CBAR")
+        assert colorbar_registry.get_cbar_dict("TEST_CBAR")["cmap"]["name"] == "TEST_CMAP"
+
+        pycolorbar.colormaps.unregister("TEST_CMAP")
+        with pytest.raises(ValueError):
+            colorbar_registry.get_cbar_dict("TEST_CBAR")
+
     def test_get_cbar_dict_resolve_reference(self, colorbar_registry, colorbar_test_filepath):
         """Test get_cbar_dict resolves references."""
         colorbar_registry.register(colorbar_test_filepath)
@@ -168,6 +215,60 @@ class TestColorbarRegistry:
         diff = DeepDiff(resolved_dict, expected_dict)
         assert diff == {}, f"Dictionaries are not equal: {diff}"
 
+    def test_add_cbar_dict_reference_is_copied(self, colorbar_registry, colorbar_test_filepath):
+        """Test the registry does not share the reference dictionary with the user."""
+        colorbar_registry.register(colorbar_test_filepath)
+        reference_cbar_dict = {"reference": "TEST_CBAR_1"}
+        colorbar_registry.add_cbar_dict(reference_cbar_dict, name="TEST_REFERENCE_CBAR")
+        assert colorbar_registry.registry["TEST_REFERENCE_CBAR"] is not reference_cbar_dict
+
+        # Assert that modifying the input dictionary does not affect the registry
+        reference_cbar_dict["reference"] = "TEST_CBAR_2"
+        assert colorbar_registry.get_cbar_dict("TEST_REFERENCE_CBAR", resolve_reference=False) == {
+            "reference": "TEST_CBAR_1",
+        }
+        resolved_dict = colorbar_registry.get_cbar_dict("TEST_REFERENCE_CBAR")
+        expected_dict = colorbar_registry.get_cbar_dict("TEST_CBAR_1")
+        diff = DeepDiff(resolved_dict, expected_dict)
+        assert diff == {}, f"Dictionaries are not equal: {diff}"
+
+    def test_get_cbar_dict_chained_references(self, colorbar_registry, tmp_path):
+        """Test get_cbar_dict resolves chained references and detects circular references."""
+        filepath = tmp_path / "chained_references.yaml"
+        cbar_dicts = {
+            "TEST_CBAR": {"cmap": {"name": "viridis"}},
+            "TEST_REFERENCE_1": {"reference": "TEST_REFERENCE_2"},
+            "TEST_REFERENCE_2": {"reference": "TEST_CBAR"},
+            "TEST_CIRCULAR_1": {"reference": "TEST_CIRCULAR_2"},
+            "TEST_CIRCULAR_2": {"reference": "TEST_CIRCULAR_1"},
+        }
+        write_yaml(cbar_dicts, filepath)
+        colorbar_registry.register(filepath)
+        resolved_dict = colorbar_registry.get_cbar_dict("TEST_REFERENCE_1")
+        expected_dict = colorbar_registry.get_cbar_dict("TEST_CBAR")
+        diff = DeepDiff(resolved_dict, expected_dict)
+        assert diff == {}, f"Dictionaries are not equal: {diff}"
+        with pytest.raises(ValueError):
+            colorbar_registry.get_cbar_dict("TEST_CIRCULAR_1")
+
+    def test_get_cbar_dict_invalid_reference_type(self, colorbar_registry, colorbar_test_filepath):
+        """Test an invalid reference type does not prevent resolving the other references."""
+        colorbar_registry.register(colorbar_test_filepath)
+        colorbar_registry.add_cbar_dict({"reference": "TEST_CBAR_1"}, name="TEST_REFERENCE_CBAR")
+        colorbar_registry.register_many({"TEST_INVALID_REFERENCE_CBAR": {"reference": ["TEST_CBAR_1"]}})
+
+        # Assert that the valid reference is resolved
+        resolved_dict = colorbar_registry.get_cbar_dict("TEST_REFERENCE_CBAR")
+        expected_dict = colorbar_registry.get_cbar_dict("TEST_CBAR_1")
+        diff = DeepDiff(resolved_dict, expected_dict)
+        assert diff == {}, f"Dictionaries are not equal: {diff}"
+        plot_kwargs, _ = colorbar_registry.get_plot_kwargs("TEST_REFERENCE_CBAR")
+        assert plot_kwargs["cmap"].name == "viridis"
+
+        # Assert that the invalid reference is reported by the validation
+        with pytest.raises(ValueError):
+            colorbar_registry.get_cbar_dict("TEST_INVALID_REFERENCE_CBAR")
+
     def test_get_cmap(self, colorbar_registry, colorbar_test_filepath):
         """Test the get_cmap method."""
         colorbar_registry.register(colorbar_test_filepath)
@@ -276,6 +377,16 @@ class TestColorbarRegistry:
         names = colorbar_registry.available(exclude_referenced=True)
         assert names == ["TEST_CBAR_1", "TEST_CBAR_2"]
 
+        # Test it include the colorbars referencing a colorbar of the category
+        colorbar_registry.add_cbar_dict({"reference": "TEST_CBAR_2"}, name="TEST_REFERENCE_CBAR")
+        names = colorbar_registry.available(category="test")
+        assert names == ["TEST_CBAR_2", "TEST_REFERENCE_CBAR"]
+
+        # Test the referenced colorbars are not resolved when excluded
+        colorbar_registry.register_many({"TEST_BROKEN_REFERENCE_CBAR": {"reference": "INEXISTENT_CBAR"}})
+        names = colorbar_registry.available(category="TEST", exclude_referenced=True)
+        assert names == ["TEST_CBAR_2"]
+
     def test_show_colorbar(self, colorbar_registry, colorbar_test_filepath, mock_matplotlib_show):
         """Test show_colorbar method."""
         # Register cbar
@@ -356,6 +467,22 @@ def test_register_colorbars(colorbar_registry, tmp_path):
     assert pycolorbar.colorbars.names == []
 
 
+def test_register_colorbars_overwriting_warning(colorbar_registry, tmp_path, capsys):
+    """Tests register_colorbars prints a single warning for the duplicated and already registered colorbars."""
+    write_yaml({"TEST_CBAR_1": {"cmap": {"name": "viridis"}}}, tmp_path / "temp_colorbar.yaml")
+    write_yaml({"TEST_CBAR_1": {"cmap": {"name": "plasma"}}}, tmp_path / "temp_colorbar1.yaml")
+    colorbar_registry.add_cbar_dict({"cmap": {"name": "viridis"}}, name="TEST_CBAR_1")
+    capsys.readouterr()
+
+    pycolorbar.register_colorbars(directory=tmp_path)
+    captured = capsys.readouterr()
+    assert captured.out == "Warning: Overwriting existing colorbar 'TEST_CBAR_1'\n"
+
+    # Test overwriting is not allowed with force=False
+    with pytest.raises(ValueError):
+        pycolorbar.register_colorbars(directory=tmp_path, force=False)
+
+
 def test_available_colorbars(colorbar_registry, colorbar_test_filepath):
     """Test available_colorbars."""
     # Register colorbars
@@ -28,6 +28,7 @@
 import os
 from contextlib import contextmanager
 
+import numpy as np
 import pytest
 from pydantic import ValidationError
 
@@ -177,8 +178,11 @@ class TestColormapSettings:
         "color",
         [
             "#ff0000",  # valid hex
+            "#f00",  # valid short hex
+            "#ff000080",  # valid hex with alpha
             (1, 0, 0),  # valid RGB tuple
             [1, 0, 0],  # valid RGB tuple
+            [np.float32(1), np.float32(0.5), np.float64(0)],  # valid RGB list with numpy scalars
             (1, 0, 0, 1),  # valid RGBA tuple (if bad/over/under alpha provided ... RGB alpha will be overwritten !)
             "red",  # valid named color
             "none",
@@ -199,8 +203,13 @@ class TestColormapSettings:
         [
             "not_a_color",  # invalid named color
             "#ZZZZZZ",  # invalid hex
+            "#ff000",  # invalid hex length
             (256, 256, 256),  # invalid RGB tuple
             (0, 1),  # invalid format
+            ("1", 0, 0),  # invalid RGB tuple with string
+            [b"1", 0, 0],  # invalid RGB list with bytes
+            [float("nan"), 0, 0],  # invalid RGB list with NaN
+            [np.float32("nan"), 0, 0],  # invalid RGB list with numpy NaN
         ],
     )
     def test_invalid_colors(self, color):
@@ -242,6 +251,7 @@ class TestNormSettings:
             {"name": "BoundaryNorm", "boundaries": [0, 0.5, 1], "ncolors": 4, "clip": False, "extend": "both"},
             {"name": "BoundaryNorm", "boundaries": [0, 0.5, 1], "ncolors": 3, "clip": False, "extend": "min"},
             {"name": "BoundaryNorm", "boundaries": [0, 0.5, 1], "ncolors": 3, "clip": False, "extend": "max"},
+            {"name": "BoundaryNorm", "boundaries": list(range(100))},
             # Testing TwoSlopeNorm settings
             {"name": "TwoSlopeNorm", "vcenter": 0.5},
             {"name": "TwoSlopeNorm", "vcenter": 0.5, "vmin": 0, "vmax": 1},
@@ -288,6 +298,10 @@ class TestNormSettings:
                 {"name": "BoundaryNorm", "boundaries": [1, 0.5, 0], "ncolors": 2},
                 "'boundaries' must be monotonically increasing",
             ),
+            (
+                {"name": "BoundaryNorm", "boundaries": [*range(50), 0, *range(51, 100)]},
+                "'boundaries' must be monotonically increasing",
+            ),
             # Invalid TwoSlopeNorm settings due to vcenter not being between vmin and vmax
             ({"name": "TwoSlopeNorm", "vcenter": 0.5, "vmin": 0.5, "vmax": 1}, "'vmin' must be less than 'vcenter'"),
             ({"name": "TwoSlopeNorm", "vcenter": 0.5, "vmin": 0, "vmax": 0.5}, "'vmax' must be larger than 'vcenter'"),
@@ -327,6 +341,13 @@ class TestNormSettings:
         with pytest.raises(ValueError):
             check_norm_settings(norm_settings)
 
+    def test_invalid_arguments_error_message(self):
+        """Test that the error message lists the sorted invalid arguments."""
+        norm_settings = {"name": "Norm", "vmin": 0, "unexpected": 1, "extra": 2}
+        with pytest.raises(ValueError) as exc_info:
+            check_norm_settings(norm_settings)
+        assert "Invalid parameters ['extra', 'unexpected'] for normalization type 'Normalize'." in str(exc_info.value)
+
     @pytest.mark.parametrize(
         "norm_name, missing_param",
         [
@@ -345,6 +366,23 @@ class TestNormSettings:
         norm_settings = check_norm_settings(norm_settings)
         assert norm_settings["ncolors"] == 2
 
+    @pytest.mark.parametrize(
+        "norm_settings, expected_keys",
+        [
+            ({"name": "Norm"}, ["vmin", "vmax", "clip", "name"]),
+            (
+                {"name": "SymLogNorm", "linthresh": 0.1},
+                ["linthresh", "linscale", "base", "vmin", "vmax", "clip", "name"],
+            ),
+            ({"name": "PowerNorm", "gamma": 0.5}, ["gamma", "vmin", "vmax", "clip", "name"]),
+            ({"name": "AsinhNorm"}, ["linear_width", "vmin", "vmax", "clip", "name"]),
+        ],
+    )
+    def test_norm_settings_keys_order(self, norm_settings, expected_keys):
+        """Test that the validated norm settings follow the order of the norm arguments."""
+        norm_settings = check_norm_settings(norm_settings)
+        assert list(norm_settings) == expected_keys
+
 
 class TestColorbarSettings:
     @pytest.mark.parametrize("extend", ["neither", "both", "min", "max", None])
@@ -482,6 +520,9 @@ class TestValidateCbarDict:
         with pytest.raises(ValueError) as excinfo:
             validate_cbar_dict(cbar_dict, name="dummy")
         assert "Invalid configuration" in str(excinfo.value), "Invalid colorbar dictionary should raise ValueError."
+        assert "Colormap validation error" in str(excinfo.value)
+        assert "Norm validation error" in str(excinfo.value)
+        assert "Colorbar validation error" in str(excinfo.value)
 
     def test_simple_cbar_dict(self):
         """Test validate_cbar_dict with the simplest allowed colorbar dictionary."""
@@ -564,3 +605,15 @@ class TestValidateCbarDict:
         }
         with pytest.raises(ValueError):
             validate_cbar_dict(cbar_dict, name="dummy")
+
+    def test_validation_cache(self, setup_colormap_registry):
+        """Test that the cached validation returns independent copies and accounts for the registered colormaps."""
+        cbar_dict = {"cmap": {"name": setup_colormap_registry}, "norm": {"name": "Norm", "vmin": 0, "vmax": 1}}
+        validated_dict = validate_cbar_dict(cbar_dict, name="dummy")
+        validated_dict["norm"]["vmin"] = -1
+        assert validate_cbar_dict(cbar_dict, name="dummy")["norm"]["vmin"] == 0
+
+        # Check validation fails once the colormap is unregistered
+        ColormapRegistry.get_instance().unregister(setup_colormap_registry)
+        with pytest.raises(ValueError):
+            validate_cbar_dict(cbar_dict, name="dummy")
@@ -0,0 +1,109 @@
+# -----------------------------------------------------------------------------.
+# MIT License
+
+# Copyright (c) 2024 pycolorbar developers
+#
+# This file is part of pycolorbar.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -----------------------------------------------------------------------------.
+"""Test colorbar visualization functions."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pycolorbar
+from pycolorbar.settings.colorbar_registry import ColorbarRegistry
+from pycolorbar.settings.colorbar_visualization import save_colorbars
+from pycolorbar.utils.yaml import write_yaml
+
+
+@pytest.fixture
+def colorbar_registry():
+    """Fixture to initialize and reset the colorbar registry."""
+    registry = ColorbarRegistry.get_instance()
+    registry.reset()
+
+    yield registry
+
+    registry.reset()
+
+
+@pytest.fixture
+def colorbar_test_filepath(tmp_path):
+    """Fixture to create a temporary colorbar YAML file."""
+    filepath = tmp_path / "temp_colorbar.yaml"
+    cbar_dict1 = {"cmap": {"name": "viridis"}}
+    cbar_dict2 = {"cmap": {"name": "viridis"}, "auxiliary": {"category": "TEST"}}
+    cbar_dicts = {"TEST_CBAR_1": cbar_dict1, "TEST_CBAR_2": cbar_dict2}
+    write_yaml(cbar_dicts, filepath)
+    return filepath
+
+
+def test_save_colorbars(colorbar_registry, colorbar_test_filepath, tmp_path):
+    """Test save_colorbars writes a PNG file per colorbar."""
+    colorbar_registry.register(colorbar_test_filepath)
+    names = colorbar_registry.names
+    list_args = [[name, *colorbar_registry.get_plot_kwargs(name=name)] for name in names]
+    filepaths = save_colorbars(list_args, directory=str(tmp_path), max_workers=2)
+    assert filepaths == [os.path.join(tmp_path, f"{name}.png") for name in names]
+    assert all(os.path.isfile(filepath) for filepath in filepaths)
+
+
+@pytest.mark.parametrize("name", ["", ".", "..", "../OUTSIDE", "SUB/CBAR", os.path.join("SUB", "CBAR")])
+def test_save_colorbars_invalid_name(colorbar_registry, tmp_path, name):
+    """Test save_colorbars does not write files for names that are not valid filenames."""
+    directory = tmp_path / "export"
+    list_args = [[name, *colorbar_registry.get_plot_kwargs(name=None)]]
+    with pytest.raises(ValueError) as excinfo:
+        save_colorbars(list_args, directory=str(directory), max_workers=1)
+    assert f"The colorbar name '{name}' can not be used as a PNG filename." in str(excinfo.value)
+    assert not os.path.exists(directory)
+
+
+def test_export_colorbars(colorbar_registry, colorbar_test_filepath, tmp_path):
+    """Test the ColorbarRegistry and pycolorbar export_colorbars methods."""
+    colorbar_registry.register(colorbar_test_filepath)
+
+    # Test export of a category
+    filepaths = colorbar_registry.export_colorbars(directory=str(tmp_path), category="TEST", max_workers=1)
+    assert filepaths == [os.path.join(tmp_path, "TEST_CBAR_2.png")]
+    assert os.path.isfile(filepaths[0])
+
+    # Test the module-level function
+    filepaths = pycolorbar.export_colorbars(directory=str(tmp_path / "all"), max_workers=2)
+    assert filepaths == [os.path.join(tmp_path, "all", f"{name}.png") for name in ["TEST_CBAR_1", "TEST_CBAR_2"]]
+    assert all(os.path.isfile(filepath) for filepath in filepaths)
+
+
+def test_export_colorbars_empty_registry(colorbar_registry, tmp_path):
+    """Test export_colorbars raises an error when no colorbars are registered."""
+    with pytest.raises(ValueError) as excinfo:
+        colorbar_registry.export_colorbars(directory=str(tmp_path))
+    assert "No colorbars are yet registered in the pycolorbar ColorbarRegistry." in str(excinfo.value)
+
+
+def test_import_does_not_load_pyplot():
+    """Test importing pycolorbar does not import matplotlib.pyplot."""
+    code = "import sys, pycolorbar; sys.exit('matplotlib.pyplot' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code], check=False).returncode == 0
@@ -32,7 +32,7 @@ import numpy as np
 import pytest
 from deepdiff import DeepDiff
 
-from pycolorbar.settings.colormap_io import read_cmap_dict, write_cmap_dict
+from pycolorbar.settings.colormap_io import read_cmap_dict, read_cmap_metadata, write_cmap_dict
 
 
 @pytest.fixture
@@ -90,6 +90,17 @@ def test_custom_write_read_cmap_dict(tmp_path, test_cmap_dict, validate):
     assert diff != {}, f"Dictionaries are not equal: {diff}"
 
 
+def test_read_cmap_metadata(tmp_path, test_cmap_dict):
+    """Test reading the auxiliary metadata of a colormap YAML file."""
+    filepath = os.path.join(tmp_path, "test_cmap.yaml")
+    write_cmap_dict(test_cmap_dict, filepath, force=True)
+    assert read_cmap_metadata(filepath) == {}
+
+    auxiliary = {"category": ["diverging"]}
+    write_cmap_dict({**test_cmap_dict, "auxiliary": auxiliary}, filepath, force=True)
+    assert read_cmap_metadata(filepath) == auxiliary
+
+
 def test_write_invalid_cmap_dict(tmp_path):
     """Test write_cmap_dict with missing keys or colors."""
     # Define filepath
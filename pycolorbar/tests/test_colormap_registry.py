@@ -236,6 +236,58 @@ class TestColormapRegistry:
         colormap_registry.add_cmap_dict(cmap_dict=TEST_CMAP_DICT, name=cmap_name, verbose=False)
         assert isinstance(colormap_registry.get_cmap_dict(cmap_name), dict)
 
+    def test_get_cmap_dict_cache(self, colormap_registry, tmp_path):
+        """Test get_cmap_dict returns a copy of the cached dictionary and re-reads modified files."""
+        cmap_name = "test_cmap"
+        cmap_filepath = os.path.join(tmp_path, f"{cmap_name}.yaml")
+        write_yaml(TEST_CMAP_DICT, cmap_filepath)
+        colormap_registry.register(filepath=cmap_filepath, verbose=False)
+
+        # Check modifications of the returned dictionary do not affect the cache
+        cmap_dict = colormap_registry.get_cmap_dict(cmap_name)
+        cmap_dict["color_palette"][0] = 0
+        assert colormap_registry.get_cmap_dict(cmap_name)["color_palette"][0] == "#ff0000"
+
+        # Check the file is read again if modified
+        write_yaml({**TEST_CMAP_DICT, "color_palette": ["#000000", "#ffffff"]}, cmap_filepath)
+        stat = os.stat(cmap_filepath)
+        os.utime(cmap_filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert len(colormap_registry.get_cmap_dict(cmap_name)["color_palette"]) == 2
+
+    def test_get_cmap_cache(self, colormap_registry, tmp_path):
+        """Test get_cmap creates again the colormap if the YAML file is modified."""
+        cmap_name = "test_cmap"
+        cmap_filepath = os.path.join(tmp_path, f"{cmap_name}.yaml")
+        write_yaml(TEST_CMAP_DICT, cmap_filepath)
+        colormap_registry.register(filepath=cmap_filepath, verbose=False)
+        assert colormap_registry.get_cmap(cmap_name).N == 3
+        assert pycolorbar.get_cmap(cmap_name).N == 3
+
+        # Modify the colormap YAML file
+        write_yaml({**TEST_CMAP_DICT, "color_palette": ["#000000", "#ffffff"]}, cmap_filepath)
+        stat = os.stat(cmap_filepath)
+        os.utime(cmap_filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert colormap_registry.get_cmap(cmap_name).N == 2
+        assert pycolorbar.get_cmap(cmap_name).N == 2
+
+    def test_names_cache(self, colormap_registry):
+        """Test the cached colormap names are updated at each registry update."""
+        colormap_registry.add_cmap_dict(cmap_dict=TEST_CMAP_DICT, name="test_cmap", verbose=False)
+        colormap_registry.add_cmap_dict(cmap_dict=TEST_CMAP_DICT, name="test_cmap_r", verbose=False)
+        assert colormap_registry.names == ["test_cmap", "test_cmap_r"]
+
+        # Check the set of names with the reversed names is reused (also if a name ends with '_r')
+        names_with_reversed = colormap_registry._get_names_with_reversed()
+        assert names_with_reversed == {"test_cmap", "test_cmap_r", "test_cmap_r_r"}
+        assert colormap_registry._get_names_with_reversed() is names_with_reversed
+
+        # Check the caches are updated when replacing a colormap without changing the registry size
+        colormap_registry.unregister("test_cmap_r")
+        colormap_registry.add_cmap_dict(cmap_dict=TEST_CMAP_DICT, name="another_cmap", verbose=False)
+        assert colormap_registry.names == ["another_cmap", "test_cmap"]
+        assert "another_cmap_r" in colormap_registry._get_names_with_reversed()
+        assert "test_cmap_r_r" not in colormap_registry._get_names_with_reversed()
+
     def test_get_cmap(self, colormap_registry):
         """Test get_cmap method."""
         cmap_name = "test_cmap"
@@ -418,6 +470,17 @@ class TestGetCmap:
         assert isinstance(reversed_cmap, Colormap)
         # assert cmap.reversed()(0) == reversed_cmap(0)  # TODO BUG
 
+    def test_pycolorbar_cmap_cache(self, colormap_registry):
+        """Test the cached pycolorbar colormaps are not modified by the returned colormaps."""
+        cmap_name = "test_cmap"
+        colormap_registry.add_cmap_dict(cmap_dict=TEST_CMAP_DICT, name=cmap_name, verbose=False)
+        cmap = pycolorbar.get_cmap(name=cmap_name, lut=2)
+        assert cmap.N == 2
+        cmap.set_bad("red")
+        new_cmap = pycolorbar.get_cmap(name=cmap_name, lut=2)
+        assert new_cmap is not cmap
+        assert new_cmap.get_bad().tolist() != cmap.get_bad().tolist()
+
 
 def test_available_colormaps(colormap_registry, tmp_path):
     """Test available_colormaps returns matplotlib and pycolorbar colormaps."""
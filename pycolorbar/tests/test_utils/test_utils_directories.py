@@ -8,64 +8,133 @@ import os
 
 import pytest
 
-from pycolorbar.utils.directories import list_files, remove_file_if_exists
+from pycolorbar.utils.directories import iter_files, list_files, remove_file_if_exists
 
 
-def test_list_files(tmp_path):
-    """Test list_files functions."""
-    # Set up test environment
-    ext = "yaml"
-    dir1 = tmp_path / "dir1"
-    dir1.mkdir()
-
-    dir1_dummy = tmp_path / "dir1_dummy"
-    dir1_dummy.mkdir()
-
-    dir2 = dir1 / "dir2"
-    dir2.mkdir()
-
-    dir2_dummy = dir1 / "dir2_dummy"
-    dir2_dummy.mkdir()
-
-    file1 = tmp_path / f"file1.{ext}"
-    file2 = tmp_path / f"file2.{ext}"
-    file3 = tmp_path / "file3.ANOTHER"
-
-    file4 = dir1 / f"file4.{ext}"
-    file5 = dir1 / "file5.ANOTHER"
-
-    file6 = dir2 / f"file6.{ext}"
-
-    file1.touch()
-    file2.touch()
-    file3.touch()
-    file4.touch()
-    file5.touch()
-    file6.touch()
+def _touch(filepath):
+    """Create an empty file."""
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    os.close(fd)
 
-    glob_pattern = "*"
-    expected_files = [file1, file2, file3]
-    assert set(list_files(tmp_path, glob_pattern, recursive=False)) == set(map(str, expected_files))
 
-    glob_pattern = os.path.join("*", "*")
-    expected_files = [file4, file5]
-    assert set(list_files(tmp_path, glob_pattern, recursive=False)) == set(map(str, expected_files))
-
-    glob_pattern = f"*.{ext}"
-    expected_files = [file1, file2]
-    assert set(list_files(tmp_path, glob_pattern, recursive=False)) == set(map(str, expected_files))
-
-    glob_pattern = os.path.join("*", f"*.{ext}")
-    expected_files = [file4]
-    assert set(list_files(tmp_path, glob_pattern, recursive=False)) == set(map(str, expected_files))
-
-    glob_pattern = f"*.{ext}"
-    expected_files = [file1, file2, file4, file6]
-    assert set(list_files(tmp_path, glob_pattern, recursive=True)) == set(map(str, expected_files))
-
-    glob_pattern = os.path.join("*", f"*.{ext}")
-    expected_files = [file4, file6]
-    assert set(list_files(tmp_path, glob_pattern, recursive=True)) == set(map(str, expected_files))
+@pytest.fixture(scope="module")
+def populated_tree(tmp_path_factory):
+    """Create once the directory tree used to test the listing of files."""
+    tmp_path = tmp_path_factory.mktemp("list_files")
+    ext = "yaml"
+    dir1 = os.path.join(tmp_path, "dir1")
+    dir1_dummy = os.path.join(tmp_path, "dir1_dummy")
+    dir2 = os.path.join(dir1, "dir2")
+    dir2_dummy = os.path.join(dir1, "dir2_dummy")
+
+    os.makedirs(dir2, exist_ok=True)
+    os.mkdir(dir1_dummy)
+    os.mkdir(dir2_dummy)
+
+    # Define the filepaths as strings (as returned by list_files)
+    file1 = os.path.join(tmp_path, f"file1.{ext}")
+    file2 = os.path.join(tmp_path, f"file2.{ext}")
+    file3 = os.path.join(tmp_path, "file3.ANOTHER")
+
+    file4 = os.path.join(dir1, f"file4.{ext}")
+    file5 = os.path.join(dir1, "file5.ANOTHER")
+
+    file6 = os.path.join(dir2, f"file6.{ext}")
+
+    _touch(file1)
+    _touch(file2)
+    _touch(file3)
+    _touch(file4)
+    _touch(file5)
+    _touch(file6)
+
+    files = {"file1": file1, "file2": file2, "file3": file3, "file4": file4, "file5": file5, "file6": file6}
+    return tmp_path, files
+
+
+@pytest.mark.parametrize(
+    ("glob_pattern", "recursive", "expected_names"),
+    [
+        ("*", False, ["file1", "file2", "file3"]),
+        (os.path.join("*", "*"), False, ["file4", "file5"]),
+        ("*.yaml", False, ["file1", "file2"]),
+        (os.path.join("*", "*.yaml"), False, ["file4"]),
+        ("*.yaml", True, ["file1", "file2", "file4", "file6"]),
+        (os.path.join("*", "*.yaml"), True, ["file4", "file6"]),
+    ],
+)
+def test_list_files(populated_tree, glob_pattern, recursive, expected_names):
+    """Test list_files and iter_files functions."""
+    tmp_path, files = populated_tree
+    expected_files = sorted(files[name] for name in expected_names)
+    assert sorted(list_files(tmp_path, glob_pattern, recursive=recursive)) == expected_files
+    assert sorted(iter_files(tmp_path, glob_pattern, recursive=recursive)) == expected_files
+
+
+@pytest.fixture(scope="module")
+def special_tree(tmp_path_factory):
+    """Create once a directory tree with hidden files, nested directories and symbolic links."""
+    tmp_path = tmp_path_factory.mktemp("list_special_files")
+    hidden_dir = os.path.join(tmp_path, ".hidden_dir")
+    sub_dir = os.path.join(tmp_path, "sub")
+    nested_dir = os.path.join(sub_dir, "nested")
+    os.mkdir(hidden_dir)
+    os.makedirs(nested_dir, exist_ok=True)
+
+    files = {
+        "hidden_file": os.path.join(tmp_path, ".hidden.yaml"),
+        "visible_file": os.path.join(tmp_path, "visible.yaml"),
+        "hidden_dir_file": os.path.join(hidden_dir, "file7.yaml"),
+        "sub_file": os.path.join(sub_dir, "file8.yaml"),
+        "nested_file": os.path.join(nested_dir, "file9.yaml"),
+    }
+    for filepath in files.values():
+        _touch(filepath)
+
+    # Symbolic links to a file and to a directory
+    files["link_file"] = os.path.join(tmp_path, "link.yaml")
+    try:
+        os.symlink(files["visible_file"], files["link_file"])
+        os.symlink(sub_dir, os.path.join(tmp_path, "link_dir"), target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("Symbolic links can not be created.")
+    return tmp_path, files
+
+
+@pytest.mark.parametrize(
+    ("glob_pattern", "recursive", "expected_names"),
+    [
+        # The hidden files are matched only explicitly if not recursive
+        ("*.yaml", False, ["visible_file", "link_file"]),
+        (".*", False, ["hidden_file"]),
+        # The hidden files are matched if recursive, but the symbolic links to directories are not followed
+        ("*.yaml", True, ["hidden_file", "visible_file", "link_file", "hidden_dir_file", "sub_file", "nested_file"]),
+        (".*", True, ["hidden_file"]),
+        # Patterns with multiple components
+        (os.path.join("sub", "*", "*.yaml"), False, ["nested_file"]),
+        (os.path.join("*", "*.yaml"), False, ["sub_file", "sub_file_link"]),
+        (os.path.join("nested", "*.yaml"), True, ["nested_file"]),
+        (os.path.join("sub", "*.yaml"), True, ["sub_file"]),
+        (os.path.join("*", "*", "*.yaml"), False, ["nested_file", "nested_file_link"]),
+        # Patterns with literal components
+        (os.path.join("link_dir", "nested", "*.yaml"), False, ["nested_file_link"]),
+        (os.path.join(".hidden_dir", "*.yaml"), False, ["hidden_dir_file"]),
+        (os.path.join("*", "file8.yaml"), False, ["sub_file", "sub_file_link"]),
+        (os.path.join("missing", "*.yaml"), False, []),
+        (os.path.join("visible.yaml", "*.yaml"), False, []),
+    ],
+)
+def test_list_special_files(special_tree, glob_pattern, recursive, expected_names):
+    """Test list_files and iter_files with hidden files, nested directories and symbolic links."""
+    tmp_path, files = special_tree
+    files = {
+        **files,
+        "sub_file_link": os.path.join(tmp_path, "link_dir", "file8.yaml"),
+        "nested_file_link": os.path.join(tmp_path, "link_dir", "nested", "file9.yaml"),
+    }
+    expected_files = sorted(files[name] for name in expected_names)
+    assert sorted(list_files(tmp_path, glob_pattern, recursive=recursive)) == expected_files
+    assert sorted(iter_files(tmp_path, glob_pattern, recursive=recursive)) == expected_files
 
 
 class Test_Remove_File_If_Exists:
@@ -81,11 +150,14 @@ class Test_Remove_File_If_Exists:
 
         # Check it raise an error if force=True
         with pytest.raises(ValueError):
-            remove_file_if_exists(filepath=tmp_directory, force=False)
+            remove_file_if_exists(filepath=tmp_directory, force=True)
+
+        # Check the directory is not removed
+        assert os.path.isdir(tmp_directory)
 
     def test_remove_file_if_exists_file(self, tmp_path):
         filepath = tmp_path / "test_pycolorbar.yaml"
-        filepath.write_text("This is a test file.")
+        filepath.touch()
 
         # Check it raise an error if force=False
         with pytest.raises(ValueError):
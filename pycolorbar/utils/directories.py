@@ -24,9 +24,13 @@
 # SOFTWARE.
 
 # -----------------------------------------------------------------------------.
+import fnmatch
+import functools
 import glob
 import os
 import pathlib
+import re
+import stat
 
 
 def remove_file_if_exists(filepath, force=False):
@@ -34,13 +38,17 @@ def remove_file_if_exists(filepath, force=False):
 
     Raise an error if the filepath is an existing directory.
     """
-    if os.path.exists(filepath):
-        if os.path.isdir(filepath):
-            raise ValueError("The specified {filepath} file path is an existing directory !")
-        if force:
-            os.remove(filepath)
-        else:
-            raise ValueError(f"The {filepath} already exists !")
+    # Retrieve the file status with a single system call (as os.path.exists, follow symbolic links)
+    try:
+        st = os.stat(filepath)
+    except (OSError, ValueError):
+        return
+    if stat.S_ISDIR(st.st_mode):
+        raise ValueError(f"The specified {filepath} file path is an existing directory !")
+    if force:
+        os.remove(filepath)
+    else:
+        raise ValueError(f"The {filepath} already exists !")
 
 
 def _recursive_glob(dir_path, glob_pattern):
@@ -60,8 +68,105 @@ def list_paths(dir_path, glob_pattern, recursive=False):
         return _recursive_glob(dir_path, glob_pattern)
 
 
+def _scandir(dir_path):
+    """Return the entries of a directory (or an empty list if the directory can not be read)."""
+    try:
+        with os.scandir(dir_path) as entries:
+            return list(entries)
+    except OSError:
+        return []
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_glob(component):
+    """Compile a glob pattern component into a regular expression."""
+    return re.compile(fnmatch.translate(os.path.normcase(component)))
+
+
+def _match_name(name, pattern, include_hidden):
+    """Check if a file or directory name matches a glob pattern component."""
+    # glob.glob does not match hidden names with wildcards, pathlib.Path.rglob does
+    if not include_hidden and name.startswith(".") and not pattern.startswith("."):
+        return False
+    return _compile_glob(pattern).match(os.path.normcase(name)) is not None
+
+
+def _is_single_component_pattern(glob_pattern):
+    """Check if the glob pattern only matches file names (i.e. '*.yaml')."""
+    separators = "/" + os.sep + (os.altsep or "")
+    return glob.has_magic(glob_pattern) and "**" not in glob_pattern and not any(s in glob_pattern for s in separators)
+
+
+def _split_glob_pattern(glob_pattern):
+    """Return the glob pattern components, or None if the paths returned by glob.glob can not be rebuilt from them."""
+    # The alternative separator and the empty components (i.e. 'a//*.yaml') are kept as is in the glob.glob paths
+    if os.altsep and os.altsep in glob_pattern:
+        return None
+    components = glob_pattern.split(os.sep)
+    if "" in components:
+        return None
+    return components
+
+
+def _iter_matching_files(dir_path, glob_pattern, recursive):
+    """Yield the filepaths whose name matches a single-component glob pattern.
+
+    As with glob.glob, the hidden names are not matched by the wildcards if not recursive.
+    As with pathlib.Path.rglob, the hidden names are matched and the symbolic links to directories
+    are not followed if recursive.
+    """
+    dir_paths = [os.fspath(dir_path)]
+    while dir_paths:
+        for entry in _scandir(dir_paths.pop()):
+            if recursive and entry.is_dir(follow_symlinks=False):
+                dir_paths.append(entry.path)
+            elif _match_name(entry.name, glob_pattern, include_hidden=recursive) and entry.is_file():
+                yield entry.path
+
+
+def _iter_glob_files(dir_path, components):
+    """Yield the filepaths matching the glob pattern components relative to dir_path (as glob.iglob)."""
+    *dir_components, file_component = components
+    # Retrieve the directories matching the leading pattern components
+    # - Literal components are joined without scanning the directory
+    # - Only the directories matching a pattern component are visited
+    dir_paths = [dir_path]
+    for component in dir_components:
+        if not glob.has_magic(component):
+            dir_paths = [os.path.join(path, component) for path in dir_paths]
+            dir_paths = [path for path in dir_paths if os.path.isdir(path)]
+            continue
+        dir_paths = [
+            entry.path
+            for path in dir_paths
+            for entry in _scandir(path)
+            if entry.is_dir() and _match_name(entry.name, component, include_hidden=False)
+        ]
+    # Retrieve the matching files
+    if not glob.has_magic(file_component):
+        filepaths = (os.path.join(path, file_component) for path in dir_paths)
+        yield from (filepath for filepath in filepaths if os.path.isfile(filepath))
+        return
+    for path in dir_paths:
+        for entry in _scandir(path):
+            if entry.is_file() and _match_name(entry.name, file_component, include_hidden=False):
+                yield entry.path
+
+
+def iter_files(dir_path, glob_pattern, recursive=False):
+    """Return an iterator over the filepaths (exclude directory paths)."""
+    # Scan the directories with os.scandir
+    # - If recursive, only for the simple patterns matching file names (i.e. '*.yaml')
+    # - If not recursive, level by level as glob.glob
+    if recursive and _is_single_component_pattern(glob_pattern):
+        return _iter_matching_files(dir_path, glob_pattern, recursive=True)
+    components = None if recursive else _split_glob_pattern(glob_pattern)
+    if components is not None:
+        return _iter_glob_files(os.fspath(dir_path), components)
+    paths = list_paths(dir_path, glob_pattern, recursive=recursive)
+    return (f for f in paths if os.path.isfile(f))
+
+
 def list_files(dir_path, glob_pattern, recursive=False):
     """Return a list of filepaths (exclude directory paths)."""
-    paths = list_paths(dir_path, glob_pattern, recursive=recursive)
-    filepaths = [f for f in paths if os.path.isfile(f)]
-    return filepaths
+    return list(iter_files(dir_path, glob_pattern, recursive=recursive))
@@ -24,8 +24,8 @@
 # SOFTWARE.
 
 # -----------------------------------------------------------------------------.
+import matplotlib as mpl
 import matplotlib.colors as mcolors
-import matplotlib.pyplot as plt
 import numpy as np
 
 
@@ -54,4 +54,5 @@ def get_mpl_named_colors():
 
 
 def get_mpl_colormaps():
-    return plt.colormaps()
+    # Equivalent to plt.colormaps(), without importing pyplot
+    return list(mpl.colormaps)
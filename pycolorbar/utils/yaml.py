@@ -25,9 +25,17 @@
 
 # -----------------------------------------------------------------------------.
 """YAML utility."""
+
 import yaml
 
-from pycolorbar.utils.directories import list_files
+from pycolorbar.utils.directories import iter_files, list_files
+
+# Use the LibYAML C bindings if available
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper, SafeLoader
 
 
 def read_yaml(filepath: str) -> dict:
@@ -44,7 +52,7 @@ def read_yaml(filepath: str) -> dict:
         Dictionary with the attributes read from the YAML file.
     """
     with open(filepath) as f:
-        dictionary = yaml.safe_load(f)
+        dictionary = yaml.load(f, Loader=SafeLoader)
     return dictionary
 
 
@@ -57,9 +65,13 @@ def write_yaml(dictionary, filepath, sort_keys=False):
         Dictionary to write into a YAML file.
     """
     with open(filepath, "w") as f:
-        yaml.dump(dictionary, f, sort_keys=sort_keys)
+        yaml.dump(dictionary, f, Dumper=SafeDumper, sort_keys=sort_keys)
     return
 
 
 def list_yaml_files(directory):
     return list_files(directory, glob_pattern="*.yaml", recursive=True)
+
+
+def iter_yaml_files(directory):
+    return iter_files(directory, glob_pattern="*.yaml", recursive=True)